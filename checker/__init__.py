@@ -10,6 +10,7 @@ Modules:
 - loader.py      : Input file loading (Excel/CSV with column normalization)
 - http_client.py : HTTP client for API communication
 - selector.py    : API endpoint selection logic
+- cache.py       : Parquet cache of recent lookup results (skips repeat API calls)
 - run_checker.py : Main entry point and orchestration
 
 Usage:
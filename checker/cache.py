@@ -0,0 +1,133 @@
+"""
+cache.py - Lookup Results Cache
+================================
+This module remembers the outcome of (TRN, year) lookups between runs, so
+re-running the checker on the same input doesn't call the API again for
+rows that were checked recently.
+
+How it works:
+-------------
+- Results are stored in a Parquet file (columnar + compressed, fast to read)
+- Each API server (SIDSP_BASE_URL) gets its own file, so results from one
+  environment are never reused against another
+- Each entry is keyed by (TRN, year) and keeps the CheckedAt timestamp
+- Entries older than the TTL are ignored on load and dropped on the next save
+- Only definite answers (present / absent) are cached; errors are always retried
+
+Parquet support comes from pyarrow. If pyarrow isn't installed, caching is
+simply disabled (load_cache() returns nothing and save_cache() does nothing).
+"""
+
+import hashlib
+import os
+from datetime import datetime, timedelta
+from pathlib import Path
+from typing import Dict, Any, Tuple
+
+# pyarrow is optional: without it the checker runs without a cache
+try:
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+except ImportError:
+    pa = None
+
+
+# =============================================================================
+# TYPE DEFINITIONS
+# =============================================================================
+
+# A cache maps (TRN, year) to the result fields that don't depend on the row:
+#   {("100379893", "2025"): {"EndpointUsed": ..., "HTTPStatus": 404, "Present": False,
+#                            "Note": ..., "CheckedAt": "2025-11-24T21:00:12"}}
+CacheKey = Tuple[str, str]
+Cache = Dict[CacheKey, Dict[str, Any]]
+
+# Result fields stored for each (TRN, year)
+CACHED_FIELDS = ('EndpointUsed', 'HTTPStatus', 'Present', 'Note', 'CheckedAt')
+
+# Cache file name; {server} is a short hash of the API base URL
+CACHE_FILE = ".lookup_cache_{server}.parquet"
+
+
+# =============================================================================
+# CACHE FUNCTIONS
+# =============================================================================
+
+def cache_available() -> bool:
+    """Return True if pyarrow is installed, so the cache can be used."""
+    return pa is not None
+
+
+def cache_path(directory: Path, base_url: str) -> Path:
+    """
+    Return the cache file for one API server, inside `directory`.
+    
+    The file name includes a hash of the base URL, so pointing
+    SIDSP_BASE_URL at another environment starts from an empty cache
+    instead of reusing the other environment's answers.
+    
+    Example:
+        cache_path(Path("out"), "https://api.example.com")
+            -> Path("out/.lookup_cache_137b9e5e4e13.parquet")
+    """
+    server = hashlib.sha256(base_url.encode()).hexdigest()[:12]
+    return directory / CACHE_FILE.format(server=server)
+
+
+def load_cache(path: Path, ttl_hours: float) -> Cache:
+    """
+    Load cached lookup results that are still fresh.
+
+    Args:
+        path: Path to the Parquet cache file
+        ttl_hours: Entries checked longer ago than this are ignored
+
+    Returns:
+        A dict of {(trn, year): result_fields}. Empty if the file doesn't
+        exist or pyarrow isn't installed.
+    """
+    if pa is None or not path.exists():
+        return {}
+
+    data = pq.read_table(path).to_pydict()
+    cutoff = (datetime.now() - timedelta(hours=ttl_hours)).isoformat()
+
+    cache = {}
+    for i, (trn, year) in enumerate(zip(data['trn'], data['year'])):
+        # ISO timestamps compare correctly as strings
+        if data['CheckedAt'][i] < cutoff:
+            continue
+        cache[(trn, year)] = {field: data[field][i] for field in CACHED_FIELDS}
+
+    return cache
+
+
+def save_cache(path: Path, cache: Cache):
+    """
+    Write the cache to a Parquet file (zstd-compressed).
+
+    The file is written to a temporary name first and then moved into
+    place, so an interrupted save never leaves a corrupt cache behind.
+
+    Args:
+        path: Path to the Parquet cache file
+        cache: The entries to store (replaces the file's previous contents)
+    """
+    if pa is None:
+        return
+
+    keys = list(cache)
+    table = pa.table({
+        'trn': pa.array([trn for trn, _ in keys], pa.string()),
+        'year': pa.array([year for _, year in keys], pa.string()),
+        'EndpointUsed': pa.array([cache[k]['EndpointUsed'] for k in keys], pa.string()),
+        'HTTPStatus': pa.array([cache[k]['HTTPStatus'] for k in keys], pa.int32()),
+        'Present': pa.array([cache[k]['Present'] for k in keys], pa.bool_()),
+        'Note': pa.array([cache[k]['Note'] for k in keys], pa.string()),
+        'CheckedAt': pa.array([cache[k]['CheckedAt'] for k in keys], pa.string()),
+    })
+
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp_path = path.with_name(path.name + '.tmp')
+    pq.write_table(table, tmp_path, compression='zstd')
+    os.replace(tmp_path, path)
@@ -3,6 +3,8 @@ config.py - Configuration Management
 =====================================
 This module handles loading and validating configuration from environment variables.
 It reads settings from a .env file and makes them available to the rest of the application.
+If SIDSP_BASE_URL is already set in the environment, the .env file is skipped and
+all settings come from the environment.
 
 Environment Variables Used:
 ---------------------------
@@ -13,6 +15,9 @@ Environment Variables Used:
 - SIDSP_TIMEOUT_SEC   : (Optional) Request timeout in seconds (default: 20)
 - SIDSP_CHECK_YEAR    : (Optional) Academic year to check applications for (default: "2025")
 - SIDSP_EXCEL_HEADER_ROW : (Optional) Which row contains headers in Excel files (default: 0)
+- SIDSP_CACHE_TTL_HOURS  : (Optional) Reuse lookup results from earlier runs for this many hours (default: 0 = off)
+- SIDSP_CONCURRENCY      : (Optional) How many lookups run at the same time (default: 16)
+- SIDSP_RATE_LIMIT       : (Optional) Maximum API requests per second, across all lookups (default: 4)
 
 Example .env file:
 ------------------
@@ -22,11 +27,20 @@ SIDSP_CHECK_YEAR=2025
 """
 
 from dataclasses import dataclass
+import functools
+import math
 import os
 from pathlib import Path
 from dotenv import load_dotenv
 
 
+# The .env file lives in the project root (one level up from checker/)
+# Path(__file__) = this file (config.py)
+# .resolve() = get absolute path
+# .parents[1] = go up two levels (config.py -> checker/ -> project root)
+ENV_PATH = Path(__file__).resolve().parents[1] / ".env"
+
+
 # =============================================================================
 # SETTINGS DATACLASS
 # =============================================================================
@@ -60,61 +74,87 @@ class Settings:
     # Optional: Which row in Excel files contains the column headers
     # 0 = first row (most common), 1 = second row, etc.
     excel_header_row: int = 0
+    
+    # Optional: How long a cached (TRN, year) result is reused, in hours
+    # 0 = don't use the cache at all (the default: every run checks every row)
+    cache_ttl_hours: float = 0
+    
+    # Optional: How many lookups are in flight at the same time
+    # Also sizes the HTTP connection pool, so every lookup gets a connection
+    concurrency: int = 16
+    
+    # Optional: Maximum API requests per second, shared by all lookups
+    # (retries count too), so the server isn't overwhelmed
+    rate_limit: float = 4
 
 
 # =============================================================================
 # HELPER FUNCTIONS
 # =============================================================================
 
-def _clean(v: str | None) -> str | None:
+def clean(v: str | None) -> str | None:
     """
-    Clean and normalize an environment variable value.
+    Clean and normalize a string value.
     
-    This handles common issues with .env files:
+    This handles common issues with .env files and input cells:
     - Extra whitespace around values
     - Values wrapped in quotes (single or double)
     - Empty strings that should be treated as None
     
+    Also used by the loader to clean identifier values (e.g., TRNs)
+    row by row, so it sticks to cheap string operations.
+    
+    Only a matching pair of quotes is removed, so a token or password
+    that starts or ends with a quote character is kept intact.
+    
     Examples:
-        _clean('  hello  ')     -> 'hello'
-        _clean('"quoted"')      -> 'quoted'
-        _clean("'quoted'")      -> 'quoted'
-        _clean('')              -> None
-        _clean(None)            -> None
+        clean('  hello  ')     -> 'hello'
+        clean('"quoted"')      -> 'quoted'
+        clean("'quoted'")      -> 'quoted'
+        clean("abc'")          -> "abc'"
+        clean('')              -> None
+        clean(None)            -> None
     """
     if v is None:
         return None
     
-    # Remove leading/trailing whitespace
+    # Remove surrounding whitespace
     v = v.strip()
     
-    # Remove surrounding quotes if present
-    if (v.startswith('"') and v.endswith('"')) or (v.startswith("'") and v.endswith("'")):
+    # Remove surrounding quotes if present (same quote at both ends)
+    if len(v) >= 2 and v[0] == v[-1] and v[0] in "\"'":
         v = v[1:-1]
     
     # Return None for empty strings
-    return v if v else None
+    return v or None
 
 
 # =============================================================================
 # MAIN CONFIGURATION LOADER
 # =============================================================================
 
+@functools.lru_cache(maxsize=1)
 def load_settings() -> Settings:
     """
     Load application configuration from environment variables.
     
     This function:
-    1. Finds and loads the .env file from the project root
+    1. Loads the .env file from the project root
     2. Reads all SIDSP_* environment variables
     3. Cleans and validates the values
     4. Returns a Settings object with all configuration
     
+    The result is cached: the environment doesn't change during a run, so
+    later calls return the same Settings object without re-reading .env.
+    Call load_settings.cache_clear() to force a reload.
+    
     Returns:
         Settings: A dataclass containing all configuration values
         
     Raises:
-        RuntimeError: If SIDSP_BASE_URL is not set (it's required)
+        RuntimeError: If SIDSP_BASE_URL is not set (it's required),
+                      SIDSP_CONCURRENCY is less than 1 or SIDSP_RATE_LIMIT
+                      is not a finite positive number
     
     Usage:
         settings = load_settings()
@@ -124,19 +164,16 @@ def load_settings() -> Settings:
     # ---------------------------------------------------------------------
     # STEP 1: Load the .env file
     # ---------------------------------------------------------------------
-    # The .env file should be in the project root (one level up from checker/)
-    # Path(__file__) = this file (config.py)
-    # .resolve() = get absolute path
-    # .parents[1] = go up two levels (config.py -> checker/ -> project root)
-    root_env = Path(__file__).resolve().parents[1] / ".env"
-    
     # load_dotenv reads the .env file and adds variables to os.environ
-    load_dotenv(dotenv_path=root_env)
+    # If SIDSP_BASE_URL is already set (e.g., a container or CI job that
+    # provides the environment itself), the .env file isn't read at all
+    if not os.environ.get("SIDSP_BASE_URL"):
+        load_dotenv(dotenv_path=ENV_PATH)
 
     # ---------------------------------------------------------------------
     # STEP 2: Read and validate the base URL (required)
     # ---------------------------------------------------------------------
-    base = _clean(os.getenv("SIDSP_BASE_URL"))
+    base = clean(os.getenv("SIDSP_BASE_URL"))
     
     if not base:
         raise RuntimeError(
@@ -152,6 +189,21 @@ def load_settings() -> Settings:
     # Remove trailing slash to make URL joining predictable
     # This way we can always do: base_url + "/api/v1/endpoint"
     base = base.rstrip("/")
+    
+    # Concurrency must allow at least one request at a time
+    concurrency = int(os.getenv("SIDSP_CONCURRENCY", "16"))
+    if concurrency < 1:
+        raise RuntimeError(
+            f"SIDSP_CONCURRENCY must be at least 1 (got {concurrency})."
+        )
+    
+    # The rate limit must let at least some requests through, and must be
+    # a real number ("nan" and "inf" would switch the limiter off)
+    rate_limit = float(os.getenv("SIDSP_RATE_LIMIT", "4"))
+    if not (math.isfinite(rate_limit) and rate_limit > 0):
+        raise RuntimeError(
+            f"SIDSP_RATE_LIMIT must be a finite number greater than 0 (got {rate_limit:g})."
+        )
 
     # ---------------------------------------------------------------------
     # STEP 3: Build and return the Settings object
@@ -160,16 +212,25 @@ def load_settings() -> Settings:
         base_url=base,
         
         # Authentication options (token OR email+password)
-        token=_clean(os.getenv("SIDSP_TOKEN")),
-        auth_email=_clean(os.getenv("SIDSP_AUTH_EMAIL")),
-        auth_password=_clean(os.getenv("SIDSP_AUTH_PASSWORD")),
+        token=clean(os.getenv("SIDSP_TOKEN")),
+        auth_email=clean(os.getenv("SIDSP_AUTH_EMAIL")),
+        auth_password=clean(os.getenv("SIDSP_AUTH_PASSWORD")),
         
         # Request timeout (default: 20 seconds)
         timeout_sec=int(os.getenv("SIDSP_TIMEOUT_SEC", "20")),
         
         # Year to check applications for (default: 2025)
-        check_year=_clean(os.getenv("SIDSP_CHECK_YEAR")) or "2025",
+        check_year=clean(os.getenv("SIDSP_CHECK_YEAR")) or "2025",
         
         # Excel header row (default: 0 = first row)
         excel_header_row=int(os.getenv("SIDSP_EXCEL_HEADER_ROW", "0")),
+        
+        # Cached result lifetime (default: 0 = cache off)
+        cache_ttl_hours=float(os.getenv("SIDSP_CACHE_TTL_HOURS", "0")),
+        
+        # Lookups in flight at once (default: 16)
+        concurrency=concurrency,
+        
+        # Requests per second across all lookups (default: 4)
+        rate_limit=rate_limit,
     )
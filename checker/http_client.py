@@ -12,13 +12,27 @@ Features:
 - Exponential backoff between retries
 - Bearer token authentication
 - Configurable timeouts
+- Async client (aiohttp) so many lookups can be in flight at once
+- Token-bucket rate limit shared by all concurrent requests
+- Fast JSON parsing with orjson (falls back to the json module)
 """
 
-import requests
+import asyncio
+import json
+import random
+import aiohttp
 import time
-from requests.auth import HTTPBasicAuth
 from .config import Settings
 
+# orjson is optional: it parses JSON several times faster than the json
+# module (straight from bytes, no decode step), which adds up over
+# thousands of responses. Both raise a ValueError subclass on bad input.
+try:
+    import orjson
+    json_loads = orjson.loads
+except ImportError:
+    json_loads = json.loads
+
 
 # =============================================================================
 # RETRY CONFIGURATION
@@ -31,65 +45,178 @@ from .config import Settings
 # 502 = Bad Gateway
 # 503 = Service Unavailable
 # 504 = Gateway Timeout
-RETRY_STATUSES = (408, 500, 502, 503, 504)
+RETRY_STATUSES = frozenset({408, 500, 502, 503, 504})
 
 # How many times to retry before giving up
 # Total attempts = 1 initial + MAX_RETRIES
 MAX_RETRIES = 2
 
-# How long to wait between retries (exponential backoff)
-# Wait time = BACKOFF_FACTOR * (2 ** attempt_number)
-# Attempt 0: 0.5 * 1 = 0.5 seconds
-# Attempt 1: 0.5 * 2 = 1.0 seconds
-# Attempt 2: 0.5 * 4 = 2.0 seconds
+# How long to wait between retries (exponential backoff with jitter)
+# Wait time = BACKOFF_FACTOR * (2 ** attempt_number), scaled by a random 0.5x-1.5x
+# Attempt 0: about 0.5 * 1 = 0.5 seconds
+# Attempt 1: about 0.5 * 2 = 1.0 seconds
+# Attempt 2: about 0.5 * 4 = 2.0 seconds
 BACKOFF_FACTOR = 0.5
 
 
 # =============================================================================
-# HTTP CLIENT CLASS
+# AUTHENTICATION CONFIGURATION
 # =============================================================================
 
-class HttpClient:
+# Where the token can be found in a login response, as a path of keys
+# Tried in this order; the first non-empty value wins
+TOKEN_PATHS = (
+    ("user", "token"),   # {"user": {"token": "..."}}
+    ("token",),          # {"token": "..."}
+    ("accessToken",),    # {"accessToken": "..."}
+    ("access_token",),   # {"access_token": "..."}
+)
+
+
+def backoff_delay(attempt: int) -> float:
     """
-    HTTP client for communicating with the SIDSP API.
+    How long to wait before retry number `attempt` (0-based), in seconds.
+    
+    The random jitter spreads retries out, so many requests that failed
+    together (e.g., on a 503) don't all hit the server again at the same
+    moment.
+    """
+    return BACKOFF_FACTOR * (2 ** attempt) * (0.5 + random.random())
+
+
+# =============================================================================
+# RATE LIMITING
+# =============================================================================
+
+# How many requests may go out back to back before the rate limit kicks in
+# Kept at 1 so requests are evenly spaced (1 / rate seconds apart), even
+# right at startup when every lookup is ready at once
+RATE_LIMIT_BURST = 1
+
+
+class RateLimiter:
+    """
+    Token-bucket rate limiter for asyncio tasks.
+    
+    The bucket holds up to `burst` tokens and refills at `rate` tokens per
+    second. Each request takes one token, waiting if the bucket is empty.
+    At most `burst` requests go out back to back; over time they never
+    exceed `rate` per second.
+    
+    Usage:
+        limiter = RateLimiter(4)   # 4 requests per second
+        async with limiter:
+            ...make the request...
+    """
+    
+    def __init__(self, rate: float, burst: int = RATE_LIMIT_BURST):
+        """
+        Args:
+            rate: Requests allowed per second
+            burst: Requests allowed back to back (the bucket size)
+        """
+        self.rate = rate
+        self.capacity = float(burst)
+        self._tokens = self.capacity
+        self._updated = time.monotonic()
+        
+        # Waiters queue on the lock, so tokens are handed out first come, first served
+        self._lock = asyncio.Lock()
+    
+    async def acquire(self):
+        """Wait until a token is available, then take it."""
+        async with self._lock:
+            while True:
+                # Refill for the time that passed since the last check
+                now = time.monotonic()
+                self._tokens = min(
+                    self.capacity,
+                    self._tokens + (now - self._updated) * self.rate
+                )
+                self._updated = now
+                
+                if self._tokens >= 1:
+                    self._tokens -= 1
+                    return
+                
+                # Sleep just long enough for the next token
+                await asyncio.sleep((1 - self._tokens) / self.rate)
+    
+    async def __aenter__(self):
+        await self.acquire()
+        return self
+    
+    async def __aexit__(self, exc_type, exc, tb):
+        return None
+
+
+# =============================================================================
+# ASYNC HTTP CLIENT CLASS
+# =============================================================================
+
+class AsyncHttpClient:
+    """
+    HTTP client for communicating with the SIDSP API, built on aiohttp.
     
     This client handles:
     - Authentication (either via login or static token)
     - Making GET requests to API endpoints
     - Automatic retry on transient failures
-    - Session management
+    - Rate limiting and connection pooling
+    
+    The network methods are coroutines. This lets the checker keep many
+    TRN/year lookups in flight at once instead of waiting for each round
+    trip before starting the next one.
+    
+    The client must be created inside a running event loop (aiohttp
+    binds its connection pool to the loop). Create one client per run and
+    share it between all concurrent lookups, so they reuse one pool of
+    keep-alive connections.
     
     Usage:
-        # Create client
-        client = HttpClient(settings)
-        
-        # Authenticate (one of these)
-        client.set_static_token("your-token-here")  # If you have a token
-        client.login_and_set_token()                # To login and get a token
-        
-        # Make API calls
-        status, content_type, body = client.get_json("/api/v2/Applications/ByYearTRN", {"trn": "123", "year": "2025"})
-        
-        # Clean up
-        client.close()
+        # Create client (inside an async function); closed on exit
+        async with AsyncHttpClient(settings) as client:
+            
+            # Authenticate (one of these)
+            client.set_static_token("your-token-here")
+            await client.login_and_set_token()
+            
+            # Make API calls (can be run concurrently with asyncio.gather)
+            status, content_type, body = await client.get_json("/api/v2/Applications/ByYearTRN", {"trn": "123", "year": "2025"})
     """
     
     def __init__(self, settings: Settings):
         """
-        Initialize the HTTP client.
+        Initialize the async HTTP client.
         
         Args:
             settings: Configuration object containing base URL, timeout, and auth settings
         """
         self.settings = settings
         
-        # Create a requests Session for connection pooling and cookie persistence
-        # Sessions are more efficient than making individual requests
-        self.s = requests.Session()
+        # One connection pool shared by all concurrent requests:
+        # - limit / limit_per_host: one connection per concurrent request
+        #   (everything goes to the same API host)
+        # - ttl_dns_cache: cache DNS lookups for 5 minutes
+        connector = aiohttp.TCPConnector(
+            limit=settings.concurrency,
+            limit_per_host=settings.concurrency,
+            ttl_dns_cache=300
+        )
+        self.s = aiohttp.ClientSession(
+            connector=connector,
+            headers={"Accept": "application/json"}  # We always expect JSON back
+        )
         
         # Store commonly used settings for convenience
-        self.base = settings.base_url      # e.g., "https://api.example.com"
-        self.timeout = settings.timeout_sec # e.g., 20 seconds
+        self.base = settings.base_url
+        self.timeout = settings.timeout_sec
+        self._client_timeout = aiohttp.ClientTimeout(total=self.timeout)
+        self._token_path = None
+        
+        # Shared by every get_json() call on this client
+        # (settings.rate_limit requests per second, from SIDSP_RATE_LIMIT)
+        self._limiter = RateLimiter(settings.rate_limit)
 
     # -------------------------------------------------------------------------
     # AUTHENTICATION METHODS
@@ -99,28 +226,19 @@ class HttpClient:
         """
         Set the Bearer token authorization header for all future requests.
         
-        This is called after successful authentication to ensure all
-        subsequent API calls include the authorization token.
-        
         Args:
             token: The JWT or access token to use for authorization
         """
-        self.s.headers.update({
-            "Authorization": f"Bearer {token}",  # Standard Bearer token format
-            "Accept": "application/json"          # We expect JSON responses
-        })
+        self.s.headers["Authorization"] = f"Bearer {token}"  # Standard Bearer token format
 
     def _extract_token(self, data: dict) -> str | None:
         """
         Extract the authentication token from an API response.
         
-        Different APIs return tokens in different structures:
-        - {"user": {"token": "..."}}    - Nested under 'user'
-        - {"token": "..."}              - Direct 'token' key
-        - {"accessToken": "..."}        - camelCase 'accessToken'
-        - {"access_token": "..."}       - snake_case 'access_token'
-        
-        This method tries each structure in order and returns the first token found.
+        Different APIs return tokens in different structures (see
+        TOKEN_PATHS). This method tries each structure in order and returns
+        the first token found. The structure that matched is remembered, so
+        a later re-login tries it first.
         
         Args:
             data: The JSON response from the authentication endpoint
@@ -128,23 +246,24 @@ class HttpClient:
         Returns:
             The token string if found, None otherwise
         """
-        # Try nested structure first: {"user": {"token": "..."}}
-        if "user" in data and isinstance(data["user"], dict):
-            if "token" in data["user"]:
-                return data["user"]["token"]
+        paths = TOKEN_PATHS
+        if self._token_path is not None:
+            paths = (self._token_path, *TOKEN_PATHS)
         
-        # Try flat structures
-        if "token" in data:
-            return data["token"]
-        if "accessToken" in data:
-            return data["accessToken"]
-        if "access_token" in data:
-            return data["access_token"]
+        for path in paths:
+            # Walk down the keys, e.g. data["user"]["token"]
+            value = data
+            for key in path:
+                value = value.get(key) if isinstance(value, dict) else None
+            
+            if value:
+                self._token_path = path
+                return value
         
         # No token found
         return None
 
-    def login_and_set_token(self):
+    async def login_and_set_token(self):
         """
         Perform programmatic login to get an authentication token.
         
@@ -155,53 +274,46 @@ class HttpClient:
         Raises:
             RuntimeError: If credentials are missing, login fails, or no token is returned
         """
-        # Build the authentication URL
         url = f"{self.base}/api/v1/Auth"
         
-        # Get credentials from settings
         email = self.settings.auth_email
         pwd = self.settings.auth_password
 
-        # Validate credentials are provided
         if not (email and pwd):
             raise RuntimeError(
                 "Missing SIDSP_AUTH_EMAIL or SIDSP_AUTH_PASSWORD. "
                 "Set these in .env or provide SIDSP_TOKEN instead."
             )
 
-        # Prepare the request
-        # We send credentials both in the JSON body and as Basic Auth headers
-        # (some APIs accept one or the other)
         payload = {"email": email, "password": pwd}
         headers = {"Content-Type": "application/json", "Accept": "application/json"}
         
-        # Make the login request
-        r = self.s.post(
-            url, 
-            auth=HTTPBasicAuth(email, pwd),  # Basic Auth header
-            json=payload,                     # JSON body with credentials
-            headers=headers, 
-            timeout=self.timeout
-        )
+        async with self.s.post(
+            url,
+            auth=aiohttp.BasicAuth(email, pwd),
+            json=payload,
+            headers=headers,
+            timeout=self._client_timeout
+        ) as r:
+            raw = await r.read()
+            status = r.status
+            content_type = r.headers.get("content-type", "").lower()
+        
+        text = raw.decode("utf-8", errors="replace")
 
-        # Check for expected 201 Created status
-        # Some APIs return 200 OK, but this one expects 201
-        if r.status_code != 201:
+        if status != 201:
             raise RuntimeError(
-                f"Authentication failed with status {r.status_code}. "
-                f"Response: {r.text[:300]}"
+                f"Authentication failed with status {status}. "
+                f"Response: {text[:300]}"
             )
 
-        # Verify we got JSON back
-        content_type = r.headers.get("content-type", "").lower()
         if "application/json" not in content_type:
             raise RuntimeError(
                 f"Expected JSON response but got {content_type}. "
-                f"Body: {r.text[:200]}"
+                f"Body: {text[:200]}"
             )
         
-        # Parse the response and extract the token
-        data = r.json()
+        data = json_loads(raw)
         token = self._extract_token(data)
         
         if not token:
@@ -210,16 +322,12 @@ class HttpClient:
                 f"Response keys: {list(data.keys())}"
             )
         
-        # Set the token for all future requests
         self._set_auth_header(token)
 
     def set_static_token(self, token: str):
         """
         Use a pre-existing token instead of logging in.
         
-        This is useful when you already have a valid token (e.g., from
-        the SIDSP_TOKEN environment variable) and don't need to login.
-        
         Args:
             token: The JWT or access token to use
         """
@@ -229,15 +337,13 @@ class HttpClient:
     # API REQUEST METHODS
     # -------------------------------------------------------------------------
     
-    def get_json(self, path: str, params: dict | None = None):
+    async def get_json(self, path: str, params: dict | None = None):
         """
         Make a GET request to an API endpoint with automatic retry.
         
-        This method:
-        1. Builds the full URL from base + path
-        2. Makes the GET request with optional query parameters
-        3. Retries on transient failures (server errors, network issues)
-        4. Returns the response details
+        While this request waits on the network (or on a retry backoff),
+        other requests on the same client keep running. Every attempt waits
+        for the client's rate limiter (SIDSP_RATE_LIMIT) first.
         
         Args:
             path: The API endpoint path (e.g., "/api/v2/Applications/ByYearTRN")
@@ -245,72 +351,60 @@ class HttpClient:
             
         Returns:
             A tuple of (status_code, content_type, body):
-            - status_code: HTTP status code (e.g., 200, 404, 500)
+            - status_code: HTTP status code (e.g., 200, 404, 500), 0 on network failure
             - content_type: The Content-Type header value
-            - body: The response body as a string
-            
-        Example:
-            status, content_type, body = client.get_json(
-                "/api/v2/Applications/ByYearTRN",
-                {"trn": "100379893", "year": "2025"}
-            )
-            if status == 200:
-                data = json.loads(body)
-                print(f"Found {len(data)} applications")
+            - body: The raw response body as bytes (not decoded, so callers
+              that only look at the status don't pay for text decoding;
+              json_loads() parses bytes directly)
         """
-        # Build the full URL
         url = f"{self.base}{path}"
         
-        # Retry loop
         for attempt in range(MAX_RETRIES + 1):
             try:
-                # Make the GET request
-                r = self.s.get(url, params=params, timeout=self.timeout)
+                await self._limiter.acquire()
+                async with self.s.get(url, params=params, timeout=self._client_timeout) as r:
+                    body = await r.read()
+                    status = r.status
+                    content_type = r.headers.get("content-type", "")
                 
-                # Check if we should retry (server error and not last attempt)
-                if r.status_code in RETRY_STATUSES and attempt < MAX_RETRIES:
-                    # Calculate wait time with exponential backoff
-                    wait_time = BACKOFF_FACTOR * (2 ** attempt)
+                if status in RETRY_STATUSES and attempt < MAX_RETRIES:
+                    wait_time = backoff_delay(attempt)
                     print(
-                        f"[{r.status_code}] Retrying {path} in {wait_time:.2f}s "
+                        f"[{status}] Retrying {path} in {wait_time:.2f}s "
                         f"(Attempt {attempt + 1}/{MAX_RETRIES})..."
                     )
-                    time.sleep(wait_time)
-                    continue  # Try again
+                    await asyncio.sleep(wait_time)
+                    continue
                 
-                # Return the result (success or non-retryable error)
-                return (
-                    r.status_code, 
-                    r.headers.get("content-type", ""), 
-                    r.text or ""  # Return full response body
-                )
+                return status, content_type, body or b""
 
-            except requests.RequestException as e:
+            except (aiohttp.ClientError, asyncio.TimeoutError) as e:
                 # Network errors: timeout, connection refused, DNS failure, etc.
                 if attempt < MAX_RETRIES:
-                    wait_time = BACKOFF_FACTOR * (2 ** attempt)
+                    wait_time = backoff_delay(attempt)
                     print(
                         f"[Network Error] Retrying {path} in {wait_time:.2f}s "
                         f"(Attempt {attempt + 1}/{MAX_RETRIES})..."
                     )
-                    time.sleep(wait_time)
-                    continue  # Try again
+                    await asyncio.sleep(wait_time)
+                    continue
                 
-                # Final failure after all retries
-                return 0, "", f"Network error: {type(e).__name__}: {e}"
+                return 0, "", f"Network error: {type(e).__name__}: {e}".encode()
 
-        # Should never reach here, but just in case
-        return 0, "", "Max retries exceeded unexpectedly"
+        return 0, "", b"Max retries exceeded unexpectedly"
     
     # -------------------------------------------------------------------------
     # CLEANUP METHODS
     # -------------------------------------------------------------------------
     
-    def close(self):
+    async def close(self):
         """
-        Close the HTTP session and release resources.
-        
-        Always call this when you're done with the client to properly
-        close connections and free up resources.
+        Close the aiohttp session and release pooled connections.
         """
-        self.s.close()
+        await self.s.close()
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb):
+        await self.close()
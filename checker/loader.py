@@ -7,8 +7,12 @@ consistent column names regardless of how they appear in the input file.
 
 Supported Input Formats:
 ------------------------
-- Excel files: .xlsx, .xls
-- CSV files: .csv
+- Excel files: .xlsx (streamed with openpyxl), .xls (pandas, using the
+  python-calamine engine when installed with pandas 2.2+, otherwise xlrd)
+- CSV files: .csv (streamed with pyarrow when installed, otherwise the csv module)
+
+Rows are streamed with iter_input_data() where the format allows it, so
+large files don't have to fit in memory.
 
 Column Name Normalization:
 --------------------------
@@ -22,21 +26,85 @@ This way, the rest of the code can always reference columns by their
 canonical names without worrying about input file variations.
 """
 
+import csv
 import pandas as pd
-from typing import List, Dict, Any
+from functools import lru_cache, reduce
+from itertools import chain, islice
+from openpyxl import load_workbook
+from typing import List, Dict, Any, Iterator
 from pathlib import Path
 import re
+from .config import clean
+
+# pyarrow is optional: its multithreaded CSV reader is much faster, but
+# the standard csv module is used as a fallback when it isn't installed
+try:
+    import pyarrow as pa
+    import pyarrow.compute as pc
+    import pyarrow.csv as pacsv
+except ImportError:
+    pa = None
+
+# python-calamine is optional: a Rust-based Excel reader that pandas can use
+# for .xls files, several times faster than the default xlrd engine.
+# pandas only accepts engine='calamine' from version 2.2 on.
+try:
+    import python_calamine  # Only checked for; pandas loads it itself
+    _PANDAS_VERSION = tuple(int(part) for part in re.findall(r'\d+', pd.__version__)[:2])
+    XLS_ENGINE = 'calamine' if _PANDAS_VERSION >= (2, 2) else None
+except ImportError:
+    XLS_ENGINE = None  # Let pandas pick its default (xlrd)
+
+
+# =============================================================================
+# COLUMN NAME MAPPING
+# =============================================================================
+# This maps normalized column names to the canonical names used by the app.
+# 
+# How it works:
+#   1. Input column "Customer_TRN" gets normalized to "CUSTOMERTRN"
+#   2. "CUSTOMERTRN" is looked up in this map
+#   3. It maps to "CUSTOMER_TRN" (the canonical name with underscore)
+#
+# Why do this? So we can use consistent column names in our code regardless
+# of how the input file formats its headers.
+
+COLUMN_MAP = {
+    'CUSTOMERTRN': 'CUSTOMER_TRN',       # Customer's Tax Registration Number
+    'REGISTRATIONNO': 'REGISTRATION_NO', # Application registration number (e.g., SLB-156439)
+    'ACADEMICYEAR': 'ACADEMIC_YEAR',     # Academic year (e.g., 2025)
+    'BENEFICIARYTRN': 'BENEFICIARY_TRN', # Beneficiary's TRN (if different from customer)
+}
+
+# Identifier columns are always kept as strings, never numbers
+# (numbers would lose leading zeros or turn large TRNs into scientific notation)
+TEXT_COLUMNS = frozenset(COLUMN_MAP.values())
+
+# pyarrow CSV reader: how much of the file is parsed at a time, in bytes
+CSV_BLOCK_SIZE = 8 << 20  # 8 MB
+
+# CUSTOMER_TRN is required because it's the main identifier we use to
+# look up applications in the API
+REQUIRED_COLUMNS = ['CUSTOMER_TRN']
 
 
 # =============================================================================
 # COLUMN NAME NORMALIZATION
 # =============================================================================
 
+# Matches one or more whitespace characters or underscores
+# Compiled once here instead of on every normalize_header() call
+_HEADER_RE = re.compile(r'[\s_]+')
+
+
+@lru_cache(maxsize=1024)
 def normalize_header(header: str) -> str:
     """
     Standardize a column name by removing spaces/underscores and converting to uppercase.
     
     This makes column matching case-insensitive and format-insensitive.
+    Results are cached, since the same header names come up again for
+    every file.
     
     Examples:
         normalize_header("Customer TRN")   -> "CUSTOMERTRN"
@@ -50,39 +118,475 @@ def normalize_header(header: str) -> str:
     Returns:
         A normalized version of the column name (uppercase, no spaces/underscores)
     """
-    # Remove all spaces and underscores using regex
-    # [\s_]+ matches one or more whitespace characters or underscores
-    normalized = re.sub(r'[\s_]+', '', header)
+    # Remove all spaces and underscores using the precompiled regex, then
+    # convert to uppercase (no strip() needed: the regex already removed
+    # every whitespace character, leading and trailing included)
+    return _HEADER_RE.sub('', header).upper()
+
+
+def _canonical_columns(columns) -> Dict[Any, str]:
+    """
+    Build a mapping from original column names to canonical names.
     
-    # Remove any leading/trailing whitespace and convert to uppercase
-    return normalized.strip().upper()
+    Each column is normalized with normalize_header() and then looked up
+    in COLUMN_MAP. Columns that are not in the map keep their normalized
+    name. If two columns end up with the same name, only the first one is
+    renamed (this prevents duplicate columns if the input has both
+    "Customer TRN" and "customer_trn").
+    
+    Args:
+        columns: The original column names, in file order
+        
+    Returns:
+        A dict of {original_name: canonical_name}
+    """
+    normalized_columns = {}
+    used_names = set()  # Canonical names already taken (fast "already used?" check)
+    
+    for col in columns:
+        # First, normalize the column name (remove spaces/underscores, uppercase)
+        normalized_name = normalize_header(str(col))
+        
+        # Then, map it to the canonical name if one exists
+        # If not in the map, keep the normalized name as-is
+        final_name = COLUMN_MAP.get(normalized_name, normalized_name)
+
+        # Only add this mapping if the destination name isn't already used
+        if final_name not in used_names:
+            normalized_columns[col] = final_name
+            used_names.add(final_name)
+    
+    return normalized_columns
+
+
+def _check_required_columns(columns):
+    """
+    Raise ValueError if any of REQUIRED_COLUMNS is missing.
+    
+    Args:
+        columns: The column names after normalization
+    """
+    columns = list(columns)
+    missing = [col for col in REQUIRED_COLUMNS if col not in columns]
+    
+    if missing:
+        raise ValueError(
+            f"Required columns missing: {missing}. "
+            f"Available columns after normalization: {columns}"
+        )
+
+
+def _identifier_columns(headers: List[str]) -> Dict[str, str]:
+    """
+    Pick the identifier columns to read from a header row.
+    
+    Used by the streaming readers (.xlsx and .csv), which check the header
+    as soon as they have read it, before any data rows.
+    
+    Args:
+        headers: The header row, as written in the file
+        
+    Returns:
+        A dict of {original_name: canonical_name} for the columns that map
+        into COLUMN_MAP (first match wins for duplicates)
+        
+    Raises:
+        ValueError: If required columns are missing
+    """
+    columns = _canonical_columns(headers)
+    _check_required_columns(columns.get(col, col) for col in headers)
+    
+    return {col: name for col, name in columns.items() if name in TEXT_COLUMNS}
+
+
+def _as_text(value: Any) -> str | None:
+    """
+    Convert an identifier cell to a cleaned string.
+    
+    Numbers are converted the way pandas dtype=str would, then the text
+    is cleaned with config.clean() (whitespace/quotes stripped, empty -> None).
+    
+    Examples:
+        _as_text(100379893)      -> '100379893'
+        _as_text(100379893.0)    -> '100379893'
+        _as_text(' SLB-156439 ') -> 'SLB-156439'
+        _as_text(None)           -> None
+    """
+    if value is None:
+        return None
+    
+    # Excel stores all numbers as floats; 100379893.0 should read as "100379893"
+    if isinstance(value, float) and value.is_integer():
+        value = int(value)
+    
+    return clean(str(value))
+
+
+# =============================================================================
+# EXCEL STREAMING READER
+# =============================================================================
+
+def _xlsx_rows(filepath: str, header_row: int = 0) -> Iterator[tuple]:
+    """
+    Stream the raw rows of an .xlsx file as tuples, one row at a time.
+    
+    Uses openpyxl's read-only mode, which parses the worksheet XML lazily
+    instead of loading the whole workbook (or building a DataFrame) first.
+    Memory use stays flat no matter how many rows the sheet has.
+    
+    Args:
+        filepath: Path to the .xlsx file
+        header_row: Which row contains column headers (0-indexed, default: 0)
+        
+    Yields:
+        The header row first (blank header cells get the same placeholder
+        names pandas would use), then every non-empty data row
+    """
+    # read_only=True streams rows; data_only=True returns cached formula values
+    wb = load_workbook(filepath, read_only=True, data_only=True)
+    
+    try:
+        # Only the first (active) worksheet is read, like pd.read_excel
+        rows = wb.active.iter_rows(values_only=True)
+        
+        # Skip ahead to the header row (a sheet without one has no columns)
+        headers = next(islice(rows, header_row, header_row + 1), ())
+        yield tuple(
+            str(h) if h is not None else f"Unnamed: {i}"
+            for i, h in enumerate(headers)
+        )
+        
+        for row in rows:
+            # Skip rows that are completely empty
+            if all(v is None or v == '' for v in row):
+                continue
+            yield row
+    
+    finally:
+        # Read-only workbooks keep the file open until closed
+        wb.close()
+
+
+def iter_rows_xlsx(filepath: str, header_row: int = 0) -> Iterator[Dict[str, Any]]:
+    """
+    Stream the rows of an .xlsx file as dictionaries, one row at a time.
+    
+    The header row is checked for the required columns as soon as it is
+    read, so a sheet without a CUSTOMER_TRN column raises even if it has
+    no data rows.
+    
+    Args:
+        filepath: Path to the .xlsx file
+        header_row: Which row contains column headers (0-indexed, default: 0)
+        
+    Yields:
+        One dict per non-empty data row, keyed by the original header names.
+        Example: {'Registration No': 'SLB-156439', 'Customer_TRN': 100379893, ...}
+        
+    Raises:
+        ValueError: If required columns are missing
+    """
+    rows = _xlsx_rows(filepath, header_row)
+    headers = next(rows)
+    _identifier_columns(headers)
+    
+    for row in rows:
+        yield dict(zip(headers, row))
+
+
+def _iter_xlsx(filepath: str, header_row: int) -> Iterator[Dict[str, Any]]:
+    """
+    Stream records from an .xlsx file, reading only the identifier columns.
+    
+    Produces the same records as the CSV and .xls readers: canonical
+    identifier column names, values as cleaned strings and a 1-based
+    InputRow. The identifier values are picked out by position, so if a
+    header repeats a column (e.g., "Customer TRN" and "CUSTOMER_TRN") the
+    first one is used, as in the other readers.
+    
+    Args:
+        filepath: Path to the .xlsx file
+        header_row: Which row contains column headers (0-indexed)
+        
+    Yields:
+        One dictionary per non-empty data row
+        
+    Raises:
+        ValueError: If required columns are missing (checked before the
+                    first data row is read)
+    """
+    rows = _xlsx_rows(filepath, header_row)
+    headers = list(next(rows))
+    wanted = _identifier_columns(headers)
+    names = list(wanted.values())
+    
+    # Where each identifier column sits in a row
+    positions = [headers.index(col) for col in wanted]
+    width = max(positions) + 1
+    
+    for input_row, row in enumerate(rows, start=1):
+        # Short rows (missing trailing cells) count as empty cells
+        if len(row) < width:
+            row += (None,) * (width - len(row))
+        
+        record = {'InputRow': input_row}
+        record.update(zip(names, [_as_text(row[i]) for i in positions]))
+        yield record
+
+
+# =============================================================================
+# CSV READER
+# =============================================================================
+
+def _clean_arrow(values: "pa.Array") -> "pa.Array":
+    """
+    Apply clean() to a whole column of strings at once.
+    
+    Same result as calling clean() on each value: surrounding whitespace,
+    then a matching pair of surrounding quotes, are stripped, and empty
+    strings become None.
+    """
+    values = pc.utf8_trim_whitespace(values)
+    
+    # Values with the same quote character at both ends lose that pair
+    quoted = pc.and_(
+        pc.greater_equal(pc.utf8_length(values), 2),
+        pc.or_(
+            pc.and_(pc.starts_with(values, '"'), pc.ends_with(values, '"')),
+            pc.and_(pc.starts_with(values, "'"), pc.ends_with(values, "'")),
+        ),
+    )
+    values = pc.if_else(quoted, pc.utf8_slice_codeunits(values, 1, -1), values)
+    
+    return pc.if_else(pc.equal(values, ''), pa.scalar(None, pa.string()), values)
+
+
+def _iter_csv_arrow(filepath: str) -> Iterator[Dict[str, Any]]:
+    """
+    Stream records from a .csv file with pyarrow, keeping only the identifier columns.
+    
+    Every column is read as a string straight away, so no type inference
+    is done. The other columns are only used to tell completely empty
+    rows apart from rows that have data but no identifier (those are kept,
+    so they are reported). The file is read in blocks of CSV_BLOCK_SIZE
+    (8 MB), so memory use doesn't grow with the file size.
+    
+    Each block is cleaned, filtered and renamed inside Arrow, and only
+    then turned into Python dictionaries (in one to_pylist() call).
+    
+    pyarrow rejects rows with fewer or more cells than the header. If the
+    file has such a row, reading continues with _iter_csv() (which pads
+    short rows) from the first row that wasn't yielded yet.
+    
+    Args:
+        filepath: Path to the .csv file
+        
+    Yields:
+        One dictionary per non-empty data row
+    """
+    # Read just the header line to decide which columns to keep
+    with open(filepath, newline='', encoding='utf-8-sig') as f:
+        headers = next(csv.reader(f), [])
+    wanted = _identifier_columns(headers)
+    names = list(wanted.values())
+    
+    # Where each identifier column sits in a row (by position, since the
+    # header may repeat a name)
+    positions = [headers.index(col) for col in wanted]
+    
+    input_row = 0
+    try:
+        reader = pacsv.open_csv(
+            filepath,
+            read_options=pacsv.ReadOptions(block_size=CSV_BLOCK_SIZE),
+            convert_options=pacsv.ConvertOptions(
+                column_types={col: pa.string() for col in headers},
+                # Only empty cells become None, not ''; text such as "NA"
+                # or "null" is kept, as the csv module fallback does
+                strings_can_be_null=True,
+                null_values=[''],
+            ),
+        )
+        
+        for batch in reader:
+            # Skip rows that are completely empty (every cell, not just the
+            # identifiers, so a row with a blank TRN is still reported)
+            empty = reduce(pc.and_, [pc.is_null(col) for col in batch.columns])
+            
+            # Strip whitespace/quotes from identifier values (e.g., " 100379893")
+            columns = [_clean_arrow(batch.column(i)) for i in positions]
+            table = pa.Table.from_arrays(columns, names=names).filter(pc.invert(empty))
+            
+            # Number the rows that are left, continuing from the previous block
+            count = table.num_rows
+            table = table.add_column(
+                0, 'InputRow', pa.array(range(input_row + 1, input_row + count + 1))
+            )
+            input_row += count
+            
+            yield from table.to_pylist()
+    
+    except pa.ArrowInvalid:
+        # A ragged row: the block holding it was never yielded, so re-read
+        # the file with the csv module and skip the rows already handed out
+        yield from islice(_iter_csv(filepath), input_row, None)
+
+
+def _iter_csv(filepath: str) -> Iterator[Dict[str, Any]]:
+    """
+    Stream records from a .csv file with the standard csv module.
+    
+    Used when pyarrow isn't installed (or can't parse the file). Produces
+    the same records as _iter_csv_arrow(), one line at a time, without
+    building a DataFrame.
+    Rows are read as plain lists (csv.reader) and the identifier values are
+    picked out by position, so no dict is built for the full row.
+    
+    Args:
+        filepath: Path to the .csv file
+        
+    Yields:
+        One dictionary per non-empty data row
+    """
+    # utf-8-sig skips the byte-order mark Excel puts at the start of CSV exports
+    with open(filepath, newline='', encoding='utf-8-sig') as f:
+        reader = csv.reader(f)
+        headers = next(reader, [])
+        wanted = _identifier_columns(headers)
+        names = list(wanted.values())
+        
+        # Where each identifier column sits in a row
+        positions = [headers.index(col) for col in wanted]
+        width = max(positions) + 1
+        
+        input_row = 0
+        for row in reader:
+            # Skip rows that are completely empty (every cell, not just the
+            # identifiers, so a row with a blank TRN is still reported)
+            if not any(row):
+                continue
+            
+            # Short rows (missing trailing cells) count as empty cells
+            if len(row) < width:
+                row += [''] * (width - len(row))
+            values = [clean(row[i]) for i in positions]
+            
+            input_row += 1
+            record = {'InputRow': input_row}
+            record.update(zip(names, values))
+            yield record
+
+
+# =============================================================================
+# LEGACY EXCEL READER
+# =============================================================================
+
+def _iter_xls(filepath: str, header_row: int) -> Iterator[Dict[str, Any]]:
+    """
+    Load a legacy .xls file with pandas and yield its records.
+    
+    Unlike the other readers this loads the whole file first; .xls is the
+    only format without a streaming reader here. Only the identifier
+    columns end up in the records, so they match the CSV readers' records.
+    
+    Args:
+        filepath: Path to the .xls file
+        header_row: Which row contains column headers (0-indexed)
+        
+    Yields:
+        One dictionary per non-empty data row
+    """
+    # -------------------------------------------------------------------------
+    # STEP 1: Read the file
+    # -------------------------------------------------------------------------
+    # We specify dtype=str so pandas doesn't convert identifiers to numbers
+    # (which could cause issues with leading zeros or scientific notation
+    # for large numbers like TRNs), whatever their header spelling.
+    
+    df = pd.read_excel(
+        filepath,
+        header=header_row,  # Which row has column headers
+        engine=XLS_ENGINE,  # calamine when installed, otherwise pandas' default
+        dtype=str,          # Keep identifiers as strings, not numbers
+    )
+
+    # -------------------------------------------------------------------------
+    # STEP 2: Remove rows that are completely empty
+    # -------------------------------------------------------------------------
+    # Decided on the whole row, before any columns are dropped: a row with
+    # other data but no TRN is kept, so it is reported as having no valid
+    # identifier (and the InputRow numbers match the other readers)
+    df.dropna(how='all', inplace=True)
+
+    # -------------------------------------------------------------------------
+    # STEP 3: Normalize column names
+    # -------------------------------------------------------------------------
+    # Map original column names to canonical names and assign them in one go
+    # (cheaper than df.rename(); a column whose canonical name was already
+    # taken keeps its original name, as in the other readers)
+    canonical = _canonical_columns(df.columns)
+    df.columns = [canonical.get(col, col) for col in df.columns]
+
+    # -------------------------------------------------------------------------
+    # STEP 4: Validate required columns are present
+    # -------------------------------------------------------------------------
+    _check_required_columns(df.columns)
+    
+    # Only the identifier columns are used by the checker
+    columns = [col for col in df.columns if col in TEXT_COLUMNS]
+    
+    # Strip whitespace/quotes from identifier values (e.g., " 100379893")
+    for col in columns:
+        df[col] = df[col].map(clean, na_action='ignore')
+
+    # -------------------------------------------------------------------------
+    # STEP 5: Convert to dictionaries
+    # -------------------------------------------------------------------------
+    # Each dictionary represents one row from the input file
+    # This format is convenient for iterating and accessing values by column name
+    #
+    # Built from whole columns rather than df.to_dict('records'), which
+    # converts every cell separately and is several times slower.
+    # Missing values become None, like the other readers produce.
+    #
+    # InputRow tracks each result back to the input file. It is 1-based
+    # (first non-empty data row = 1), like the other readers.
+    
+    arrays = [df[col].to_numpy(dtype=object, na_value=None) for col in columns]
+    
+    for input_row, values in enumerate(zip(*arrays), start=1):
+        record = {'InputRow': input_row}
+        record.update(zip(columns, values))
+        yield record
 
 
 # =============================================================================
 # MAIN DATA LOADER
 # =============================================================================
 
-def load_input_data(filepath: str, header_row: int = 0) -> List[Dict[str, Any]]:
+def iter_input_data(filepath: str, header_row: int = 0) -> Iterator[Dict[str, Any]]:
     """
-    Load input data from an Excel or CSV file and normalize column names.
+    Stream input data from an Excel or CSV file with normalized column names.
     
     This function:
-    1. Reads the file (Excel or CSV)
+    1. Picks a reader for the file type
     2. Normalizes column names to canonical format
-    3. Validates required columns are present
+    3. Validates required columns are present (before returning)
     4. Adds an InputRow column for tracking
-    5. Returns data as a list of dictionaries
+    5. Returns an iterator that yields one dictionary per row
+    
+    .xlsx files and (with pyarrow) .csv files are read incrementally, so
+    rows can be processed while the rest of the file is still unread.
     
     Args:
         filepath: Path to the input file (.xlsx, .xls, or .csv)
         header_row: Which row contains column headers (0-indexed, default: 0)
         
     Returns:
-        List of dictionaries, where each dict represents one row.
-        Example: [
-            {'InputRow': 1, 'CUSTOMER_TRN': '100379893', 'REGISTRATION_NO': 'SLB-156439', ...},
-            {'InputRow': 2, 'CUSTOMER_TRN': '100671551', 'REGISTRATION_NO': 'SLB-157220', ...},
-        ]
+        An iterator of dictionaries, where each dict represents one row.
+        Example rows:
+            {'InputRow': 1, 'CUSTOMER_TRN': '100379893', 'REGISTRATION_NO': 'SLB-156439', ...}
+            {'InputRow': 2, 'CUSTOMER_TRN': '100671551', 'REGISTRATION_NO': 'SLB-157220', ...}
         
     Raises:
         FileNotFoundError: If the input file doesn't exist
@@ -97,56 +601,16 @@ def load_input_data(filepath: str, header_row: int = 0) -> List[Dict[str, Any]]:
         raise FileNotFoundError(f"Input file not found: {filepath}")
 
     # -------------------------------------------------------------------------
-    # STEP 2: Define the column name mapping
+    # STEP 2: Pick the reader for the file type
     # -------------------------------------------------------------------------
-    # This maps normalized column names to the canonical names used by the app.
-    # 
-    # How it works:
-    #   1. Input column "Customer_TRN" gets normalized to "CUSTOMERTRN"
-    #   2. "CUSTOMERTRN" is looked up in this map
-    #   3. It maps to "CUSTOMER_TRN" (the canonical name with underscore)
-    #
-    # Why do this? So we can use consistent column names in our code regardless
-    # of how the input file formats its headers.
-    
-    COLUMN_MAP = {
-        'CUSTOMERTRN': 'CUSTOMER_TRN',       # Customer's Tax Registration Number
-        'REGISTRATIONNO': 'REGISTRATION_NO', # Application registration number (e.g., SLB-156439)
-        'ACADEMICYEAR': 'ACADEMIC_YEAR',     # Academic year (e.g., 2025)
-        'BENEFICIARYTRN': 'BENEFICIARY_TRN', # Beneficiary's TRN (if different from customer)
-    }
-
-    # -------------------------------------------------------------------------
-    # STEP 3: Read the file based on its type
-    # -------------------------------------------------------------------------
-    # We specify dtype=str for identifier columns to prevent pandas from
-    # converting them to numbers (which could cause issues with leading zeros
-    # or scientific notation for large numbers like TRNs).
+    # Streaming readers are used where possible; pandas only handles .xls
     
-    if path.suffix in ['.xlsx', '.xls']:
-        # Read Excel file
-        df = pd.read_excel(
-            filepath,
-            header=header_row,  # Which row has column headers
-            dtype={
-                # Keep these columns as strings, not numbers
-                'Customer_TRN': str,
-                'BeneficiaryTRN': str,
-                'Registration_No': str,
-                'Academic_Year': str,
-            }
-        )
+    if path.suffix == '.xlsx':
+        rows = _iter_xlsx(filepath, header_row)
     elif path.suffix == '.csv':
-        # Read CSV file
-        df = pd.read_csv(
-            filepath,
-            dtype={
-                'Customer_TRN': str,
-                'BeneficiaryTRN': str,
-                'Registration_No': str,
-                'Academic_Year': str,
-            }
-        )
+        rows = _iter_csv_arrow(filepath) if pa is not None else _iter_csv(filepath)
+    elif path.suffix == '.xls':
+        rows = _iter_xls(filepath, header_row)
     else:
         raise ValueError(
             f"Unsupported file type: {path.suffix}. "
@@ -154,62 +618,79 @@ def load_input_data(filepath: str, header_row: int = 0) -> List[Dict[str, Any]]:
         )
 
     # -------------------------------------------------------------------------
-    # STEP 4: Clean up the data
+    # STEP 3: Read the first row now
     # -------------------------------------------------------------------------
-    # Remove rows that are completely empty (all NaN values)
-    df.dropna(how='all', inplace=True)
+    # Generators don't run until iterated, so pull the first row here.
+    # That way header problems (e.g., missing CUSTOMER_TRN) are raised by
+    # this call instead of in the middle of processing.
+    
+    first = next(rows, None)
+    if first is None:
+        return iter([])
+    
+    return chain([first], rows)
 
-    # -------------------------------------------------------------------------
-    # STEP 5: Normalize column names
-    # -------------------------------------------------------------------------
-    # Build a mapping from original column names to normalized canonical names
+
+def load_input_data(filepath: str, header_row: int = 0) -> List[Dict[str, Any]]:
+    """
+    Load all input data from an Excel or CSV file into a list.
     
-    normalized_columns = {}
+    Convenience wrapper around iter_input_data() for callers that need
+    every row at once (e.g., to count them).
     
-    for col in df.columns:
-        # First, normalize the column name (remove spaces/underscores, uppercase)
-        normalized_name = normalize_header(str(col))
+    Args:
+        filepath: Path to the input file (.xlsx, .xls, or .csv)
+        header_row: Which row contains column headers (0-indexed, default: 0)
         
-        # Then, map it to the canonical name if one exists
-        # If not in the map, keep the normalized name as-is
-        final_name = COLUMN_MAP.get(normalized_name, normalized_name)
-
-        # Only add this mapping if the destination name isn't already used
-        # This prevents duplicate columns if input has both "Customer TRN" and "customer_trn"
-        if final_name not in normalized_columns.values():
-            normalized_columns[col] = final_name
+    Returns:
+        List of dictionaries, where each dict represents one row.
+        
+    Raises:
+        FileNotFoundError: If the input file doesn't exist
+        ValueError: If the file type is unsupported or required columns are missing
+    """
+    return list(iter_input_data(filepath, header_row))
 
-    # Apply the column renaming
-    df.rename(columns=normalized_columns, inplace=True)
 
-    # -------------------------------------------------------------------------
-    # STEP 6: Validate required columns are present
-    # -------------------------------------------------------------------------
-    # CUSTOMER_TRN is required because it's the main identifier we use to
-    # look up applications in the API
+def count_input_rows(filepath: str, header_row: int = 0) -> int | None:
+    """
+    Estimate how many data rows an input file has, without parsing it.
     
-    required_columns = ['CUSTOMER_TRN']
-    missing = [col for col in required_columns if col not in df.columns]
+    Used for progress percentages and ETAs while the rows themselves are
+    streamed. The count is cheap but approximate: blank lines and
+    completely empty rows are counted too, and CSV cells with line
+    breaks inside quotes count as extra rows.
     
-    if missing:
-        available = list(df.columns)
-        raise ValueError(
-            f"Required columns missing: {missing}. "
-            f"Available columns after normalization: {available}"
-        )
-
-    # -------------------------------------------------------------------------
-    # STEP 7: Add InputRow column for tracking
-    # -------------------------------------------------------------------------
-    # This helps us trace results back to the original input file
-    # InputRow is 1-based (first data row = 1) to match Excel row numbers
+    - .csv: counts line breaks, reading the file in 1 MB chunks
+    - .xlsx: uses the sheet size stored in the workbook (no rows are read)
+    - .xls: not known up front (returns None)
     
-    df.insert(0, 'InputRow', range(1, len(df) + 1))
-
-    # -------------------------------------------------------------------------
-    # STEP 8: Convert to list of dictionaries and return
-    # -------------------------------------------------------------------------
-    # Each dictionary represents one row from the input file
-    # This format is convenient for iterating and accessing values by column name
+    Args:
+        filepath: Path to the input file (.xlsx, .xls, or .csv)
+        header_row: Which row contains column headers (0-indexed, default: 0)
+        
+    Returns:
+        The estimated number of data rows, or None if it isn't known
+    """
+    path = Path(filepath)
+    
+    if path.suffix == '.csv':
+        with open(filepath, 'rb') as f:
+            lines = sum(chunk.count(b'\n') for chunk in iter(lambda: f.read(1 << 20), b''))
+            
+            # The last line may not end with a line break
+            if f.tell():
+                f.seek(-1, 2)
+                if f.read(1) != b'\n':
+                    lines += 1
+        return max(lines - 1, 0)  # Minus the header line
+    
+    if path.suffix == '.xlsx':
+        wb = load_workbook(filepath, read_only=True)
+        try:
+            max_row = wb.active.max_row  # None if the workbook doesn't record it
+        finally:
+            wb.close()
+        return max(max_row - header_row - 1, 0) if max_row else None
     
-    return df.to_dict('records')
+    return None
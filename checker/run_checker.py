@@ -7,9 +7,9 @@ What it does:
 -------------
 1. Loads configuration from environment variables (.env file)
 2. Authenticates with the SIDSP API
-3. Reads the input file (Excel or CSV)
-4. For each row, calls the API to check if an application exists
-5. Writes the results to a CSV file
+3. Streams rows from the input file (Excel or CSV)
+4. Checks the rows concurrently, calling the API to see if each application exists
+5. Writes each result to a CSV file as soon as it is ready
 
 Usage:
 ------
@@ -22,23 +22,40 @@ Command Line Options:
     input_file      : Path to input Excel (.xlsx, .xls) or CSV file (required)
     --output-dir    : Directory for output CSV (default: "out")
     --dry-run       : Load and validate input without making API calls
+    --refresh       : Re-check every row instead of using cached results
     --debug         : Enable debug logging for troubleshooting
+
+Cache:
+------
+Off by default: every run checks every row against the API.
+
+Set SIDSP_CACHE_TTL_HOURS (e.g., 24) to turn it on. Definite results
+(present/absent) are then cached per (TRN, year) in
+<output-dir>/.lookup_cache_<server>.parquet (one file per SIDSP_BASE_URL)
+and reused by later runs for that many hours. Reused rows are marked
+"(cached)" in the Note column. Requires pyarrow.
 """
 
 import sys
+import asyncio
 import logging
 import time
 import csv
 import argparse
+from collections import OrderedDict, deque
+from dataclasses import dataclass, replace
 from datetime import datetime
+from operator import attrgetter
 from pathlib import Path
-from typing import Dict, Any, List
-from urllib.parse import urlencode
+from typing import Dict, Any, Callable, Iterable
 
 # Import our modules
+from .cache import (
+    CACHED_FIELDS, Cache, cache_available, cache_path, load_cache, save_cache
+)
 from .config import load_settings
-from .http_client import HttpClient
-from .loader import load_input_data
+from .http_client import AsyncHttpClient, json_loads
+from .loader import count_input_rows, iter_input_data
 from .selector import select_endpoint_sequence
 
 
@@ -52,9 +69,22 @@ LOG_LEVEL = logging.INFO
 # Default output directory for result CSV files
 OUTPUT_DIR = "out"
 
-# Rate limiting: milliseconds to wait between API calls
-# This prevents overwhelming the server and getting rate-limited
-RATE_LIMIT_MS = 250  # 250ms = 4 requests per second max
+# Read-ahead: how many rows may be in progress or waiting to be written,
+# as a multiple of the concurrency (SIDSP_CONCURRENCY)
+# Bounds memory use no matter how large the input file is
+WINDOW_FACTOR = 4
+
+# Output: flush the results file to disk every this many rows
+FLUSH_EVERY = 100
+
+# Progress: log a progress line at most this often, in seconds
+PROGRESS_EVERY_SEC = 2
+
+# HTTP statuses that give a definite answer (200 = present/empty, 404 = absent)
+DEFINITE_STATUSES = frozenset({200, 404})
+
+# Response bodies that mean "nothing found": recognized without parsing JSON
+EMPTY_BODIES = frozenset({b'[]', b'{}', b'null'})
 
 
 # =============================================================================
@@ -72,15 +102,67 @@ logging.basicConfig(
 logger = logging.getLogger(__name__)
 
 
+# =============================================================================
+# TIMESTAMPS
+# =============================================================================
+
+# [whole second, ISO timestamp for that second], reused by now_iso()
+_now_cache = [-1, ""]
+
+
+def now_iso() -> str:
+    """
+    Return the current local time as an ISO string, to the second.
+    
+    Many rows finish within the same second, so the string is only built
+    once per second and reused, instead of formatting a new datetime for
+    every row.
+    
+    Example:
+        now_iso()  -> "2025-11-24T21:00:12"
+    """
+    second = int(time.time())
+    if second != _now_cache[0]:
+        _now_cache[0] = second
+        _now_cache[1] = datetime.fromtimestamp(second).isoformat()
+    return _now_cache[1]
+
+
+# =============================================================================
+# RESULT RECORD
+# =============================================================================
+
+@dataclass(slots=True)
+class RowResult:
+    """
+    The outcome of checking one input row (one row of the output CSV).
+    
+    slots=True keeps each instance small: the most recent results are held
+    for a while (so nearby rows sharing a TRN can reuse them), and a
+    slotted object takes a fraction of the memory of the equivalent dict.
+    
+    Field names match the output CSV columns (see OUTPUT_FIELDS).
+    """
+    InputRow: int | None        # Row number from input file
+    TRN: str | None             # Customer's Tax Registration Number
+    ApplicationNumber: str | None  # Registration number (e.g., SLB-156439)
+    YearChecked: str            # Year that was checked (e.g., 2025)
+    EndpointUsed: str = "NO_STRATEGY"  # Full API URL that was called
+    HTTPStatus: int = 0         # HTTP status code (200, 404, etc.)
+    Present: bool | None = None # True if found, False if not, None if not checked
+    Note: str = "No valid identifier (CUSTOMER_TRN) found"  # Human-readable explanation
+    CheckedAt: str = ""         # Timestamp of the check (empty if nothing was checked)
+
+
 # =============================================================================
 # CORE CHECKING FUNCTION
 # =============================================================================
 
-def check_row_status(
-    client: HttpClient, 
+async def check_row_status(
+    client: AsyncHttpClient, 
     row: Dict[str, Any],
     default_year: str
-) -> Dict[str, Any]:
+) -> RowResult:
     """
     Check if an application exists in the SIDSP system for a given row.
     
@@ -88,7 +170,7 @@ def check_row_status(
     1. Determines which API endpoint to call based on the row data
     2. Makes the API call (with rate limiting)
     3. Interprets the response to determine if the application exists
-    4. Returns a result dictionary with all the details
+    4. Returns a RowResult with all the details
     
     Args:
         client: The HTTP client for making API calls
@@ -96,7 +178,7 @@ def check_row_status(
         default_year: The academic year to check (e.g., "2025")
         
     Returns:
-        A dictionary containing:
+        A RowResult containing:
         - InputRow: The row number from the input file
         - TRN: The customer's Tax Registration Number
         - ApplicationNumber: The registration number (e.g., SLB-156439)
@@ -106,6 +188,7 @@ def check_row_status(
         - Present: True if found, False if not found, None if error
         - Note: Human-readable explanation of the result
         - CheckedAt: Timestamp of when the check was performed
+          (empty if the row had no TRN, so no check was made)
     """
     
     # -------------------------------------------------------------------------
@@ -114,45 +197,43 @@ def check_row_status(
     sequence = select_endpoint_sequence(row, default_year)
     
     # -------------------------------------------------------------------------
-    # STEP 2: Prepare the base result dictionary
+    # STEP 2: Prepare the base result
     # -------------------------------------------------------------------------
     # This will be updated as we make API calls
-    base_result = {
-        "InputRow": row.get('InputRow'),                    # Row number from input file
-        "TRN": row.get('CUSTOMER_TRN', ''),                 # Customer's TRN
-        "ApplicationNumber": row.get('REGISTRATION_NO', ''),# Application number
-        "YearChecked": default_year,                        # Year we're checking for
-        "EndpointUsed": "NO_STRATEGY",                      # Will be updated with actual URL
-        "HTTPStatus": 0,                                    # Will be updated with response code
-        "Present": None,                                    # True/False/None
-        "Note": "No valid identifier (CUSTOMER_TRN) found", # Human-readable note
-        "CheckedAt": datetime.now().isoformat()             # When we checked
-    }
+    # (EndpointUsed, HTTPStatus, Present and Note start at their defaults)
+    base_result = RowResult(
+        InputRow=row.get('InputRow'),                    # Row number from input file
+        TRN=row.get('CUSTOMER_TRN', ''),                 # Customer's TRN
+        ApplicationNumber=row.get('REGISTRATION_NO', ''),# Application number
+        YearChecked=default_year                         # Year we're checking for
+    )
     
     # If no endpoints to call (missing TRN), return early
+    # Nothing was checked, so CheckedAt stays empty
     if not sequence:
         return base_result
+    
+    # When we checked (only taken for rows that actually call the API)
+    base_result.CheckedAt = now_iso()
+    
+    # Look these up once for the loop below
+    get_json = client.get_json
+    
+    # Some debug messages format the whole response; only build them when
+    # debug logging is on (--debug)
+    debug = logger.isEnabledFor(logging.DEBUG)
 
     # -------------------------------------------------------------------------
     # STEP 3: Try each endpoint in the sequence
     # -------------------------------------------------------------------------
-    for path, params in sequence:
-        # Skip if no parameters (shouldn't happen, but safety check)
-        if not params:
-            continue
-        
-        # Rate limiting: wait before making the request
-        # This prevents hitting the server too fast
-        time.sleep(RATE_LIMIT_MS / 1000.0)  # Convert ms to seconds
-        
-        # Make the API call
-        status, content_type, body = client.get_json(path, params=params)
-        body_snippet = body[:200].strip()  # First 200 chars for error messages
+    # Every endpoint from the selector has parameters, so none are skipped
+    for path, params, query in sequence:
+        # Make the API call (the client applies the rate limit)
+        status, content_type, body = await get_json(path, params=params)
         
         # Record which endpoint was used (for debugging/reporting)
-        param_str = urlencode(params)
-        base_result["EndpointUsed"] = f"{path}?{param_str}"
-        base_result["HTTPStatus"] = status
+        base_result.EndpointUsed = f"{path}?{query}"
+        base_result.HTTPStatus = status
         
         # ---------------------------------------------------------------------
         # Handle the response based on status code
@@ -160,32 +241,37 @@ def check_row_status(
         
         if status == 200:
             # 200 OK - Request succeeded, but we need to check if data exists
+            
+            # The most common empty answers ([], {}, null) are short enough
+            # to spot in the raw bytes, so they skip JSON parsing entirely
+            if len(body) <= 16 and body.strip() in EMPTY_BODIES:
+                logger.debug(f"200 but empty response on {path}, trying next...")
+                continue
+            
             try:
-                import json
-                data = json.loads(body)
+                data = json_loads(body)
                 
                 # Debug logging (only visible with --debug flag)
-                logger.debug(f"Response data type: {type(data)}, value: {data}")
+                if debug:
+                    logger.debug(f"Response data type: {type(data)}, value: {data}")
                 
                 # Check if the response is "empty" in various ways
-                # The API might return 200 with an empty array/object meaning "not found"
-                is_empty = False
-                
-                if data is None:
-                    is_empty = True
-                elif isinstance(data, list) and len(data) == 0:
-                    # Empty array: []
-                    is_empty = True
-                elif isinstance(data, dict) and len(data) == 0:
-                    # Empty object: {}
-                    is_empty = True
-                elif isinstance(data, dict):
-                    # Object with empty arrays inside
-                    # e.g., {"applications": []}
-                    for value in data.values():
-                        if isinstance(value, list) and len(value) == 0:
-                            is_empty = True
-                            break
+                # The API might return 200 with an empty array/object meaning "not found":
+                # - null
+                # - Empty array: []
+                # - Empty object: {}
+                # - Object with empty arrays inside, e.g., {"applications": []}
+                # (JSON parsing only produces plain lists/dicts, so type() identity
+                # checks are enough; any() stops at the first empty array)
+                data_type = type(data)
+                is_empty = (
+                    data is None
+                    or (data_type is list and not data)
+                    or (data_type is dict and (
+                        not data
+                        or any(type(value) is list and not value for value in data.values())
+                    ))
+                )
                 
                 if is_empty:
                     # Empty response means not found, try next endpoint
@@ -193,15 +279,17 @@ def check_row_status(
                     continue
                 
                 # Data found! Application exists
-                base_result['Present'] = True
-                base_result['Note'] = f"Present (200 OK with data)"
-                logger.debug(f"Found data: {str(data)[:100]}")
+                base_result.Present = True
+                base_result.Note = f"Present (200 OK with data)"
+                if debug:
+                    logger.debug(f"Found data: {str(data)[:100]}")
                 return base_result
                 
-            except (json.JSONDecodeError, ValueError) as e:
+            except ValueError as e:
                 # Couldn't parse the response as JSON - something's wrong
-                base_result['Present'] = False
-                base_result['Note'] = f"Error: Invalid JSON response - {str(e)[:50]}"
+                # (orjson and json both raise a ValueError subclass)
+                base_result.Present = False
+                base_result.Note = f"Error: Invalid JSON response - {str(e)[:50]}"
                 return base_result
         
         elif status == 404:
@@ -213,57 +301,255 @@ def check_row_status(
         else:
             # Other error (400, 401, 403, 500, etc.)
             # These are not retryable, so return immediately
-            base_result['Present'] = False
-            base_result['Note'] = f"Error ({status}): {body_snippet}"
+            base_result.Present = False
+            # First 200 bytes of the (raw bytes) body for the error message
+            body_snippet = body[:200].decode("utf-8", errors="replace").strip()
+            base_result.Note = f"Error ({status}): {body_snippet}"
             return base_result
     
     # -------------------------------------------------------------------------
     # STEP 4: All endpoints exhausted
     # -------------------------------------------------------------------------
     # If we get here, all endpoints returned 404 or empty responses
-    if base_result.get("Present") is None:
-        base_result['Present'] = False
-        base_result['Note'] = "Absent (404 on all endpoints)"
+    if base_result.Present is None:
+        base_result.Present = False
+        base_result.Note = "Absent (404 on all endpoints)"
     
     return base_result
 
 
+def is_definite(result: RowResult) -> bool:
+    """
+    Return True if a result is a definite present/absent answer.
+    
+    Only these are worth caching: errors (auth failures, server errors,
+    network problems, unparseable responses) should be retried next run.
+    """
+    return (
+        result.HTTPStatus in DEFINITE_STATUSES
+        and not result.Note.startswith('Error')
+    )
+
+
+async def check_all_rows(
+    client: AsyncHttpClient,
+    input_rows: Iterable[Dict[str, Any]],
+    default_year: str,
+    on_result: Callable[[RowResult], None],
+    cache: Cache | None,
+    concurrency: int,
+    total_rows: int | None = None
+) -> int:
+    """
+    Check input rows concurrently, handing each result to on_result in input order.
+    
+    Up to `concurrency` lookups run at the same time. Rows are pulled from
+    input_rows only as fast as they are checked (at most
+    concurrency * WINDOW_FACTOR rows ahead), so the input can be a stream
+    of any length and memory use stays bounded.
+    
+    Rows that share a TRN (e.g., a customer with several applications)
+    share a single lookup, since the answer for a TRN + year is the same.
+    A lookup's task is dropped as soon as it finishes; its RowResult is
+    kept among the most recent results (as many as the read-ahead window
+    holds rows), so repeats close together in the input reuse it. A TRN
+    that comes back after that is looked up again (or taken from the
+    cache, when it's on). TRNs found in the cache (from an earlier run)
+    aren't looked up at all.
+    
+    Args:
+        client: The async HTTP client for making API calls
+        input_rows: Rows from the input file (any iterable, e.g., a generator)
+        default_year: The academic year to check (e.g., "2025")
+        on_result: Called with each result, in the same order as input_rows
+        cache: Cached results by (TRN, year); new definite results are added
+            (None when the cache is off: nothing is read or stored)
+        concurrency: Maximum number of lookups in flight at once
+        total_rows: Expected number of rows, if known (e.g., from
+            loader.count_input_rows()); adds a percentage and ETA to the
+            progress lines
+        
+    Returns:
+        The number of rows checked
+    """
+    semaphore = asyncio.Semaphore(concurrency)
+    window = concurrency * WINDOW_FACTOR
+    start_time = time.time()
+    next_progress = start_time + PROGRESS_EVERY_SEC  # When to log progress next
+    done = 0
+    
+    # Lookups in flight, one task per (TRN, year), shared by all rows with that TRN
+    lookups: Dict[tuple, asyncio.Future] = {}
+    
+    # Recently finished lookups: just the result, for later rows with the
+    # same TRN. Least recently used first; capped at `window` entries
+    finished: OrderedDict[tuple, RowResult] = OrderedDict()
+    
+    # Row tasks in input order; results are handed out from the front
+    pending: deque = deque()
+
+    async def lookup(key: tuple, row: Dict[str, Any]) -> RowResult:
+        # Only `concurrency` lookups get past this point at once
+        async with semaphore:
+            result = await check_row_status(client, row, default_year)
+        
+        # Remember definite answers for the next run; errors are retried
+        if cache is not None and is_definite(result):
+            cache[key] = {field: getattr(result, field) for field in CACHED_FIELDS}
+        
+        # Done: rows already waiting get the result from this task; later
+        # rows find it in `finished`, so the task itself can be let go
+        finished[key] = result
+        if len(finished) > window:
+            finished.popitem(last=False)  # Forget the least recently used
+        del lookups[key]
+        return result
+
+    async def check_one(row: Dict[str, Any]) -> RowResult:
+        key = (str(row.get('CUSTOMER_TRN') or '').strip(), default_year)
+        if key in finished:
+            # Checked a little earlier in this run
+            finished.move_to_end(key)
+            result = finished[key]
+        elif cache is not None and key not in lookups and key in cache:
+            # Checked in an earlier run and still fresh: no API call needed
+            cached = cache[key]
+            result = RowResult(
+                InputRow=None, TRN=None, ApplicationNumber=None,  # Filled in below
+                YearChecked=default_year,
+                **{**cached, "Note": f"{cached['Note']} (cached)"}
+            )
+        else:
+            if key not in lookups:
+                lookups[key] = asyncio.ensure_future(lookup(key, row))
+            result = await lookups[key]
+        
+        # The result may come from another row with the same TRN (or from
+        # the cache), so fill in this row's own identifying fields
+        # (replace() makes a copy; the shared result stays unchanged)
+        return replace(
+            result,
+            InputRow=row.get('InputRow'),
+            TRN=row.get('CUSTOMER_TRN', ''),
+            ApplicationNumber=row.get('REGISTRATION_NO', ''),
+        )
+
+    def emit(result: RowResult):
+        nonlocal done, next_progress
+        on_result(result)
+        
+        # Show progress every PROGRESS_EVERY_SEC seconds
+        # (the clock is only read every 10 completed rows)
+        done += 1
+        if done % 10 == 0:
+            now = time.time()
+            if now >= next_progress:
+                rate = done / (now - start_time)  # Rows per second
+                if total_rows and done <= total_rows:
+                    remaining = total_rows - done
+                    eta = remaining / rate  # Estimated time remaining
+                    logger.info(
+                        f"Progress: {done}/{total_rows} "
+                        f"({done/total_rows*100:.1f}%) "
+                        f"| {rate:.1f} rows/s | ETA: {eta/60:.1f}m"
+                    )
+                else:
+                    logger.info(f"Progress: {done} rows checked ({rate:.1f} rows/s)")
+                next_progress = now + PROGRESS_EVERY_SEC
+
+    try:
+        for row in input_rows:
+            pending.append(asyncio.ensure_future(check_one(row)))
+            
+            # Once the window is full, wait for the oldest row before reading more
+            if len(pending) >= window:
+                emit(await pending.popleft())
+        
+        # Input exhausted: hand out the remaining results
+        while pending:
+            emit(await pending.popleft())
+    
+    finally:
+        # Stop any work left over after an error or interruption, and wait
+        # for the cancelled tasks to finish so none are left pending
+        leftover = [*pending, *lookups.values()]
+        for task in leftover:
+            task.cancel()
+        await asyncio.gather(*leftover, return_exceptions=True)
+    
+    return done
+
+
 # =============================================================================
 # OUTPUT FUNCTIONS
 # =============================================================================
 
-def write_results_to_csv(results: List[Dict[str, Any]], output_path: Path):
+# Columns in the output CSV, in order
+OUTPUT_FIELDS = [
+    'InputRow',         # Row number from input file
+    'TRN',              # Customer's Tax Registration Number
+    'ApplicationNumber',# Registration number (e.g., SLB-156439)
+    'YearChecked',      # Year that was checked (e.g., 2025)
+    'EndpointUsed',     # Full API URL that was called
+    'HTTPStatus',       # HTTP status code (200, 404, etc.)
+    'Present',          # True if found, False if not
+    'Note',             # Human-readable explanation
+    'CheckedAt'         # Timestamp of the check
+]
+
+# Pulls a RowResult's values out as a tuple, in OUTPUT_FIELDS order
+_output_values = attrgetter(*OUTPUT_FIELDS)
+
+
+class ResultsWriter:
     """
-    Write the check results to a CSV file.
+    Writes check results to a CSV file one row at a time.
     
-    Args:
-        results: List of result dictionaries from check_row_status()
-        output_path: Path where the CSV file should be written
+    Rows are written as soon as they are ready, so results never pile up
+    in memory and an interrupted run still has every finished row on disk.
+    
+    Usage:
+        writer = ResultsWriter(Path("out/results.csv"))
+        writer.write(result)
+        writer.close()
     """
-    if not results:
-        logger.warning("No results to write")
-        return
-
-    # Define the columns in the output CSV
-    fieldnames = [
-        'InputRow',         # Row number from input file
-        'TRN',              # Customer's Tax Registration Number
-        'ApplicationNumber',# Registration number (e.g., SLB-156439)
-        'YearChecked',      # Year that was checked (e.g., 2025)
-        'EndpointUsed',     # Full API URL that was called
-        'HTTPStatus',       # HTTP status code (200, 404, etc.)
-        'Present',          # True if found, False if not
-        'Note',             # Human-readable explanation
-        'CheckedAt'         # Timestamp of the check
-    ]
-    
-    # Write the CSV file
-    with open(output_path, 'w', newline='', encoding='utf-8') as csvfile:
-        writer = csv.DictWriter(csvfile, fieldnames=fieldnames)
-        writer.writeheader()  # Write column headers
-        writer.writerows(results)  # Write all result rows
-    
-    logger.info(f"Results written to {output_path.resolve()}")
+    
+    def __init__(self, output_path: Path):
+        """
+        Create the CSV file and write the header row.
+        
+        Args:
+            output_path: Path where the CSV file should be written
+        """
+        self.path = output_path
+        self.count = 0  # Rows written so far
+        
+        # 1 MB buffer: rows reach the disk in large writes (see also FLUSH_EVERY)
+        self._file = open(
+            output_path, 'w', newline='', encoding='utf-8', buffering=1 << 20
+        )
+        
+        # A plain csv.writer: we pick the values out in OUTPUT_FIELDS order
+        # ourselves, which is cheaper than csv.DictWriter doing it per row
+        self._writer = csv.writer(self._file)
+        self._writer.writerow(OUTPUT_FIELDS)  # Write column headers
+    
+    def write(self, result: RowResult):
+        """
+        Write one result row (flushing to disk every FLUSH_EVERY rows).
+        
+        Args:
+            result: A RowResult from check_row_status()
+        """
+        self._writer.writerow(_output_values(result))
+        self.count += 1
+        
+        if self.count % FLUSH_EVERY == 0:
+            self._file.flush()
+    
+    def close(self):
+        """Flush and close the CSV file."""
+        self._file.close()
 
 
 # =============================================================================
@@ -277,7 +563,7 @@ def parse_arguments():
     Returns:
         Namespace object with the parsed arguments:
         - input_file: Path to the input file
-        - output_dir: Directory for output CSV
+        - output_dir: Directory for output CSV (a Path)
         - dry_run: Boolean, if True skip API calls
         - debug: Boolean, if True enable debug logging
     """
@@ -301,6 +587,7 @@ Examples:
     # Optional: Output directory
     parser.add_argument(
         '--output-dir',
+        type=Path,
         default=OUTPUT_DIR,
         help=f'Directory for output CSV (default: {OUTPUT_DIR})'
     )
@@ -312,6 +599,17 @@ Examples:
         help='Load and validate input without making API calls'
     )
     
+    # Optional: Ignore the lookup cache
+    parser.add_argument(
+        '--refresh',
+        action='store_true',
+        help=(
+            'Re-check every row against the API instead of reusing cached '
+            'results (the cache is only used when SIDSP_CACHE_TTL_HOURS is set; '
+            'fresh results still update it)'
+        )
+    )
+    
     # Optional: Debug mode
     parser.add_argument(
         '--debug',
@@ -323,49 +621,28 @@ Examples:
 
 
 # =============================================================================
-# MAIN EXECUTION FUNCTION
+# MAIN EXECUTION FUNCTIONS
 # =============================================================================
 
-def run_checker():
+async def process_file(args, settings):
     """
-    Main execution logic for the application checker.
+    Authenticate, check every input row and write the results.
     
-    This function:
-    1. Parses command-line arguments
-    2. Loads configuration
-    3. Authenticates with the API
-    4. Loads and processes the input file
-    5. Writes results to CSV
+    Runs inside the event loop so that the async HTTP client can keep
+    many requests in flight. Input rows are streamed from the file and
+    each result is written to the output CSV as soon as it is ready.
+    If the run stops early (e.g., Ctrl+C), the rows written so far are
+    kept as a results_partial_*.csv file.
     
-    Handles errors gracefully and supports keyboard interrupt (Ctrl+C)
-    to save partial results.
+    Args:
+        args: Parsed command-line arguments
+        settings: Loaded configuration
     """
     # -------------------------------------------------------------------------
-    # STEP 1: Parse command-line arguments
+    # STEP 3: Initialize HTTP client and authenticate
     # -------------------------------------------------------------------------
-    args = parse_arguments()
-    
-    # Enable debug logging if requested
-    if args.debug:
-        logging.getLogger().setLevel(logging.DEBUG)
-    
-    # Initialize variables
-    results = []  # Will hold all check results
-    client = None  # HTTP client (created later)
-    
-    try:
-        # ---------------------------------------------------------------------
-        # STEP 2: Load configuration from .env file
-        # ---------------------------------------------------------------------
-        settings = load_settings()
-        logger.info(f"Base URL: {settings.base_url}")
-        logger.info(f"Check Year: {settings.check_year}")
-        
-        # ---------------------------------------------------------------------
-        # STEP 3: Initialize HTTP client and authenticate
-        # ---------------------------------------------------------------------
-        client = HttpClient(settings)
-        
+    # One client (and connection pool) shared by every lookup; closed on exit
+    async with AsyncHttpClient(settings) as client:
         if settings.token:
             # Use pre-existing token from environment
             client.set_static_token(settings.token)
@@ -373,95 +650,174 @@ def run_checker():
         else:
             # No token provided, need to login
             logger.info("No static token found, attempting login...")
-            client.login_and_set_token()
+            await client.login_and_set_token()
             logger.info("Login successful")
         
         # ---------------------------------------------------------------------
-        # STEP 4: Load input data from file
+        # STEP 4: Open input data file
         # ---------------------------------------------------------------------
+        # Rows are read lazily while they are being checked
         logger.info(f"Loading data from {args.input_file}...")
-        input_rows = load_input_data(args.input_file, settings.excel_header_row)
-        logger.info(f"Loaded {len(input_rows)} rows")
+        input_rows = iter_input_data(args.input_file, settings.excel_header_row)
         
         # ---------------------------------------------------------------------
         # STEP 5: Handle dry run mode
         # ---------------------------------------------------------------------
         if args.dry_run:
+            sample = next(input_rows, None)
+            total = (1 if sample else 0) + sum(1 for _ in input_rows)
+            logger.info(f"Loaded {total} rows")
             logger.info("DRY RUN MODE - No API calls will be made")
-            logger.info(f"Sample row: {input_rows[0] if input_rows else 'No data'}")
+            logger.info(f"Sample row: {sample if sample else 'No data'}")
             logger.info("Dry run complete. Use without --dry-run to process.")
             return
         
         # ---------------------------------------------------------------------
-        # STEP 6: Process each row
+        # STEP 6: Load cached results from earlier runs
         # ---------------------------------------------------------------------
-        logger.info("Starting API checks...")
-        start_time = time.time()
+        # Off unless SIDSP_CACHE_TTL_HOURS is set; one file per API server
+        cache_file = cache_path(args.output_dir, settings.base_url)
+        use_cache = settings.cache_ttl_hours > 0 and cache_available()
+        cache = {}
         
-        for i, row in enumerate(input_rows):
-            # Show progress every 10 rows
-            if i > 0 and i % 10 == 0:
-                elapsed = time.time() - start_time
-                rate = i / elapsed  # Rows per second
-                remaining = len(input_rows) - i
-                eta = remaining / rate if rate > 0 else 0  # Estimated time remaining
-                logger.info(
-                    f"Progress: {i}/{len(input_rows)} "
-                    f"({i/len(input_rows)*100:.1f}%) "
-                    f"| ETA: {eta/60:.1f}m"
-                )
-            
-            # Check this row and add result to list
-            result = check_row_status(client, row, settings.check_year)
-            results.append(result)
+        if use_cache:
+            cache = load_cache(cache_file, settings.cache_ttl_hours)
+            logger.info(f"Loaded {len(cache)} cached results from {cache_file}")
+        elif settings.cache_ttl_hours > 0:
+            logger.info("pyarrow not installed - lookup cache disabled")
         
-        end_time = time.time()
+        # With --refresh the lookups start from an empty cache; their
+        # results are merged into the loaded one before it is saved, so
+        # entries for TRNs that aren't in this input are kept.
+        # With the cache off, lookups don't keep their results at all.
+        if not use_cache:
+            lookup_cache = None
+        elif args.refresh:
+            lookup_cache = {}
+        else:
+            lookup_cache = cache
         
         # ---------------------------------------------------------------------
-        # STEP 7: Print summary statistics
+        # STEP 7: Check the rows concurrently, writing results as they finish
         # ---------------------------------------------------------------------
-        total_present = sum(1 for r in results if r.get('Present') is True)
-        total_absent = sum(1 for r in results if r.get('Present') is False)
-        total_error = sum(
-            1 for r in results 
-            if r.get('Present') is None or (
-                r.get('HTTPStatus') not in [200, 404] and 
-                r.get('Present') is False
+        output_path = args.output_dir / f"results_{datetime.now():%Y%m%d_%H%M%S}.csv"
+        writer = ResultsWriter(output_path)
+        
+        # Summary counters, updated as each result is written
+        summary = {'present': 0, 'absent': 0, 'error': 0}
+        
+        def handle_result(result: RowResult):
+            writer.write(result)
+            
+            present = result.Present
+            if present is True:
+                summary['present'] += 1
+            elif present is False:
+                summary['absent'] += 1
+            if present is None or (
+                result.HTTPStatus not in DEFINITE_STATUSES and 
+                present is False
+            ):
+                summary['error'] += 1
+        
+        logger.info(f"Starting API checks ({settings.concurrency} concurrent)...")
+        start_time = time.time()
+        completed = False
+        
+        try:
+            total = await check_all_rows(
+                client, input_rows, settings.check_year, handle_result,
+                lookup_cache, settings.concurrency,
+                count_input_rows(args.input_file, settings.excel_header_row)
             )
-        )
+            completed = True
+        finally:
+            writer.close()
+            
+            # Save new results to the cache, even if interrupted
+            if use_cache:
+                if lookup_cache is not cache:
+                    cache.update(lookup_cache)
+                save_cache(cache_file, cache)
+            
+            # Stopped early: keep what was written as a partial results file
+            if not completed:
+                if writer.count:
+                    partial_path = output_path.with_name(
+                        output_path.name.replace("results_", "results_partial_", 1)
+                    )
+                    output_path.replace(partial_path)
+                    logger.warning(
+                        f"Partial results ({writer.count} rows) written to {partial_path.resolve()}"
+                    )
+                else:
+                    output_path.unlink()
         
-        logger.info("-" * 50)
-        logger.info(f"Processing complete in {end_time - start_time:.1f} seconds")
-        logger.info(f"Total Rows: {len(results)}")
-        logger.info(f"Present (200 OK): {total_present}")
-        logger.info(f"Absent (404): {total_absent}")
-        logger.info(f"Errors (Other): {total_error}")
-        logger.info("-" * 50)
+        end_time = time.time()
+    
+    # -------------------------------------------------------------------------
+    # STEP 8: Print summary statistics
+    # -------------------------------------------------------------------------
+    logger.info("-" * 50)
+    logger.info(f"Processing complete in {end_time - start_time:.1f} seconds")
+    logger.info(f"Total Rows: {total}")
+    logger.info(f"Present (200 OK): {summary['present']}")
+    logger.info(f"Absent (404): {summary['absent']}")
+    logger.info(f"Errors (Other): {summary['error']}")
+    logger.info("-" * 50)
+    
+    if total:
+        logger.info(f"Results written to {output_path.resolve()}")
+    else:
+        logger.warning("No results to write")
+        output_path.unlink()
+
+
+def run_checker():
+    """
+    Main execution logic for the application checker.
+    
+    This function:
+    1. Parses command-line arguments
+    2. Loads configuration
+    3. Runs process_file() in an event loop (authenticate, check, write)
+    
+    Handles errors gracefully and supports keyboard interrupt (Ctrl+C);
+    results written before the interruption are kept.
+    """
+    # -------------------------------------------------------------------------
+    # STEP 1: Parse command-line arguments
+    # -------------------------------------------------------------------------
+    args = parse_arguments()
+    
+    # Enable debug logging if requested
+    if args.debug:
+        logging.getLogger().setLevel(logging.DEBUG)
+    
+    # Create the output directory once, up front (results and cache go here)
+    args.output_dir.mkdir(parents=True, exist_ok=True)
+    
+    try:
+        # ---------------------------------------------------------------------
+        # STEP 2: Load configuration from .env file
+        # ---------------------------------------------------------------------
+        settings = load_settings()
+        logger.info(f"Base URL: {settings.base_url}")
+        logger.info(f"Check Year: {settings.check_year}")
         
         # ---------------------------------------------------------------------
-        # STEP 8: Write results to CSV
+        # STEPS 3-8: Authenticate, check rows and write results
         # ---------------------------------------------------------------------
-        output_path = Path(args.output_dir) / f"results_{datetime.now():%Y%m%d_%H%M%S}.csv"
-        output_path.parent.mkdir(parents=True, exist_ok=True)  # Create output dir if needed
-        write_results_to_csv(results, output_path)
+        asyncio.run(process_file(args, settings))
         
     except KeyboardInterrupt:
-        # User pressed Ctrl+C - save what we have so far
-        logger.warning("Interrupted by user. Saving partial results...")
-        if results:
-            output_path = Path(args.output_dir) / f"results_partial_{datetime.now():%Y%m%d_%H%M%S}.csv"
-            output_path.parent.mkdir(parents=True, exist_ok=True)
-            write_results_to_csv(results, output_path)
+        # User pressed Ctrl+C - finished rows were already saved
+        logger.warning("Interrupted by user.")
     
     except (RuntimeError, FileNotFoundError, ValueError) as e:
         # Configuration or input file errors
         logger.error(f"Fatal error: {e}")
         sys.exit(1)
-    
-    finally:
-        # Always clean up the HTTP client
-        if client:
-            client.close()
 
 
 # =============================================================================
@@ -15,18 +15,36 @@ This is the most accurate way to find applications because:
 - We specifically want to check if they have an application for THIS year (2025)
 """
 
+from functools import lru_cache
 from typing import List, Tuple, Dict, Any
+from urllib.parse import quote_plus, urlencode
 
 
 # =============================================================================
 # TYPE DEFINITIONS
 # =============================================================================
 
-# An endpoint sequence is a list of (path, params) tuples
+# An endpoint sequence is a list of (path, params, query) tuples
 # Each tuple contains:
 #   - path: The API endpoint path (e.g., "/api/v2/Applications/ByYearTRN")
 #   - params: A dictionary of query parameters (e.g., {"trn": "123", "year": "2025"})
-EndpointSequence = List[Tuple[str, Dict[str, str]]]
+#   - query: The same parameters, already URL-encoded (e.g., "trn=123&year=2025")
+EndpointSequence = List[Tuple[str, Dict[str, str], str]]
+
+
+# =============================================================================
+# QUERY STRING HELPERS
+# =============================================================================
+
+@lru_cache(maxsize=4)
+def _year_query(year: str) -> str:
+    """
+    The encoded year part of the ByYearTRN query string, e.g. "&year=2025".
+    
+    The year is the same for every row in a run, so it is encoded once and
+    reused; only the TRN needs encoding per row.
+    """
+    return "&" + urlencode({"year": year})
 
 
 # =============================================================================
@@ -53,13 +71,16 @@ def select_endpoint_sequence(
         default_year: The academic year to check (from settings, typically "2025")
     
     Returns:
-        A list of (endpoint_path, parameters) tuples.
+        A list of (endpoint_path, parameters, query_string) tuples.
+        Every entry has non-empty parameters.
         Returns empty list if no valid TRN is found.
         
     Example:
         row = {'CUSTOMER_TRN': '100379893', 'REGISTRATION_NO': 'SLB-156439'}
         sequence = select_endpoint_sequence(row, "2025")
-        # Returns: [("/api/v2/Applications/ByYearTRN", {"trn": "100379893", "year": "2025"})]
+        # Returns: [("/api/v2/Applications/ByYearTRN",
+        #            {"trn": "100379893", "year": "2025"},
+        #            "trn=100379893&year=2025")]
     """
     
     # -------------------------------------------------------------------------
@@ -87,10 +108,13 @@ def select_endpoint_sequence(
     # - It's the most accurate way to find applications for a specific year
     # - The TRN might have applications in other years we don't care about
     
+    # The encoded query string (for reporting in EndpointUsed) is the same
+    # as urlencode(params), built from the TRN plus the cached year part
     sequence = [
         (
-            "/api/v2/Applications/ByYearTRN",  # API endpoint path
-            {"trn": customer_trn, "year": year}  # Query parameters
+            "/api/v2/Applications/ByYearTRN",            # API endpoint path
+            {"trn": customer_trn, "year": year},         # Query parameters
+            "trn=" + quote_plus(customer_trn) + _year_query(year)  # Encoded query
         )
     ]
     
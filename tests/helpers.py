@@ -0,0 +1,19 @@
+"""
+helpers.py - Shared helpers for the tests
+==========================================
+"""
+
+import tempfile
+import unittest
+from pathlib import Path
+
+
+def temp_path(test: unittest.TestCase, name: str) -> Path:
+    """
+    Return a path for a file called `name` in a fresh temporary directory.
+    
+    The directory is deleted when the test finishes.
+    """
+    tmp = tempfile.TemporaryDirectory()
+    test.addCleanup(tmp.cleanup)
+    return Path(tmp.name) / name
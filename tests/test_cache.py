@@ -0,0 +1,60 @@
+"""
+test_cache.py - Tests for the lookup results cache
+===================================================
+Run with:
+    python -m unittest discover tests
+"""
+
+import unittest
+from datetime import datetime, timedelta
+from pathlib import Path
+
+from checker import cache
+from helpers import temp_path
+
+
+def entry(checked_at: datetime) -> dict:
+    return {
+        'EndpointUsed': "/api/v2/Applications/ByYearTRN?trn=100379893&year=2025",
+        'HTTPStatus': 404,
+        'Present': False,
+        'Note': "Absent (404 on all endpoints)",
+        'CheckedAt': checked_at.isoformat(timespec='seconds'),
+    }
+
+
+@unittest.skipUnless(cache.cache_available(), "pyarrow not installed")
+class CacheTest(unittest.TestCase):
+    """save_cache() / load_cache() round trip and TTL expiry."""
+
+    def setUp(self):
+        self.path = temp_path(self, ".lookup_cache.parquet")
+
+    def test_round_trip(self):
+        saved = {("100379893", "2025"): entry(datetime.now())}
+        cache.save_cache(self.path, saved)
+        self.assertEqual(cache.load_cache(self.path, ttl_hours=24), saved)
+
+    def test_expired_entries_are_dropped(self):
+        now = datetime.now()
+        cache.save_cache(self.path, {
+            ("100379893", "2025"): entry(now - timedelta(hours=1)),
+            ("100671551", "2025"): entry(now - timedelta(hours=30)),
+        })
+        self.assertEqual(
+            list(cache.load_cache(self.path, ttl_hours=24)), [("100379893", "2025")]
+        )
+
+    def test_missing_file(self):
+        self.assertEqual(cache.load_cache(self.path, ttl_hours=24), {})
+
+    def test_one_file_per_server(self):
+        directory = Path("out")
+        self.assertNotEqual(
+            cache.cache_path(directory, "https://test.example.com"),
+            cache.cache_path(directory, "https://api.example.com"),
+        )
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,47 @@
+"""
+test_config.py - Tests for configuration loading
+=================================================
+Run with:
+    python -m unittest discover tests
+"""
+
+import os
+import unittest
+from unittest import mock
+
+from checker.config import clean, load_settings
+
+
+class RateLimitSettingTest(unittest.TestCase):
+    """SIDSP_RATE_LIMIT must be a finite number greater than 0."""
+
+    def load(self, rate_limit: str):
+        env = {"SIDSP_BASE_URL": "https://api.example.com", "SIDSP_RATE_LIMIT": rate_limit}
+        load_settings.cache_clear()
+        self.addCleanup(load_settings.cache_clear)
+        with mock.patch.dict(os.environ, env):
+            return load_settings()
+
+    def test_valid(self):
+        self.assertEqual(self.load("2.5").rate_limit, 2.5)
+
+    def test_invalid(self):
+        for value in ("0", "-1", "nan", "inf"):
+            with self.subTest(value=value), self.assertRaises(RuntimeError):
+                self.load(value)
+
+
+class CleanTest(unittest.TestCase):
+    """clean() only removes a matching pair of surrounding quotes."""
+
+    def test_clean(self):
+        self.assertEqual(clean('  "quoted"  '), 'quoted')
+        self.assertEqual(clean("'quoted'"), 'quoted')
+        self.assertEqual(clean("secret'"), "secret'")
+        self.assertEqual(clean('"secret'), '"secret')
+        self.assertIsNone(clean('   '))
+        self.assertIsNone(clean(None))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,50 @@
+"""
+test_http_client.py - Tests for the HTTP client helpers
+========================================================
+Run with:
+    python -m unittest discover tests
+"""
+
+import asyncio
+import time
+import unittest
+
+from checker.http_client import RateLimiter
+
+
+class RateLimiterTest(unittest.TestCase):
+    """The token bucket spaces requests 1 / rate seconds apart."""
+
+    def acquire_all(self, limiter: RateLimiter, count: int) -> float:
+        """Take `count` tokens from concurrent tasks; return the seconds it took."""
+        async def run():
+            start = time.monotonic()
+            await asyncio.gather(*(limiter.acquire() for _ in range(count)))
+            return time.monotonic() - start
+
+        return asyncio.run(run())
+
+    def test_spacing(self):
+        # The first token is available straight away, the other 10 each
+        # take 1/20 s: about 0.5 s in total, with no burst at the start
+        elapsed = self.acquire_all(RateLimiter(20), 11)
+        self.assertGreaterEqual(elapsed, 0.45)
+        self.assertLess(elapsed, 0.8)
+
+    def test_burst(self):
+        # A bucket of 5 lets the first 5 through at once
+        elapsed = self.acquire_all(RateLimiter(20, burst=5), 5)
+        self.assertLess(elapsed, 0.05)
+
+    def test_context_manager(self):
+        async def run():
+            limiter = RateLimiter(20)
+            async with limiter:
+                pass
+            return limiter._tokens
+
+        self.assertLess(asyncio.run(run()), 1)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,127 @@
+"""
+test_loader.py - Tests for the input file loader
+=================================================
+Run with:
+    python -m unittest discover tests
+"""
+
+import unittest
+from unittest import mock
+
+from openpyxl import Workbook
+
+from checker import loader
+from helpers import temp_path
+
+
+class CsvRaggedRowTest(unittest.TestCase):
+    """CSV rows with fewer (or more) cells than the header still load."""
+
+    CONTENT = (
+        "Registration No,Customer_TRN,Academic_Year\n"
+        "SLB-1,100379893,2025\n"
+        "SLB-2,100671551\n"          # Short row: no year cell
+        "SLB-3,100724469,2025,x\n"   # Long row: one extra cell
+    )
+
+    EXPECTED = [
+        {'InputRow': 1, 'REGISTRATION_NO': 'SLB-1', 'CUSTOMER_TRN': '100379893', 'ACADEMIC_YEAR': '2025'},
+        {'InputRow': 2, 'REGISTRATION_NO': 'SLB-2', 'CUSTOMER_TRN': '100671551', 'ACADEMIC_YEAR': None},
+        {'InputRow': 3, 'REGISTRATION_NO': 'SLB-3', 'CUSTOMER_TRN': '100724469', 'ACADEMIC_YEAR': '2025'},
+    ]
+
+    def setUp(self):
+        self.path = temp_path(self, "input.csv")
+        self.path.write_text(self.CONTENT, encoding='utf-8')
+
+    def test_csv_module_reader(self):
+        self.assertEqual(list(loader._iter_csv(str(self.path))), self.EXPECTED)
+
+    @unittest.skipIf(loader.pa is None, "pyarrow not installed")
+    def test_pyarrow_reader(self):
+        self.assertEqual(list(loader._iter_csv_arrow(str(self.path))), self.EXPECTED)
+
+    def test_iter_input_data(self):
+        self.assertEqual(list(loader.iter_input_data(str(self.path))), self.EXPECTED)
+
+    @unittest.skipIf(loader.pa is None, "pyarrow not installed")
+    def test_ragged_row_after_first_block(self):
+        # "NA" must stay text in both readers, or the pyarrow reader's
+        # resume point in the csv-module fallback is off by one
+        rows = ["NA,NA,2025"] + [f"SLB-{i},{100000000 + i},2025" for i in range(2000)]
+        self.path.write_text(
+            "Registration No,Customer_TRN,Academic_Year\n"
+            + "\n".join(rows)
+            + "\nSLB-X,999\n",  # Ragged row, well past the first block
+            encoding='utf-8'
+        )
+        
+        # Small blocks so the ragged row comes after the first one
+        with mock.patch.object(loader, 'CSV_BLOCK_SIZE', 4096):
+            records = list(loader._iter_csv_arrow(str(self.path)))
+        
+        self.assertEqual(records, list(loader._iter_csv(str(self.path))))
+        self.assertEqual(records[0]['CUSTOMER_TRN'], 'NA')
+        self.assertEqual(len(records), 2002)
+
+
+class CsvBlankIdentifierTest(unittest.TestCase):
+    """A row with data but no TRN is kept; only completely empty rows are skipped."""
+
+    CONTENT = (
+        "Customer_TRN,Registration No,Name\n"
+        "100379893,SLB-1,A\n"
+        ",,B\n"                      # No identifiers, but not empty
+        ",,\n"                       # Completely empty
+        "100724469,SLB-3,C\n"
+    )
+
+    EXPECTED = [
+        {'InputRow': 1, 'CUSTOMER_TRN': '100379893', 'REGISTRATION_NO': 'SLB-1'},
+        {'InputRow': 2, 'CUSTOMER_TRN': None, 'REGISTRATION_NO': None},
+        {'InputRow': 3, 'CUSTOMER_TRN': '100724469', 'REGISTRATION_NO': 'SLB-3'},
+    ]
+
+    def setUp(self):
+        self.path = temp_path(self, "input.csv")
+        self.path.write_text(self.CONTENT, encoding='utf-8')
+
+    def test_csv_module_reader(self):
+        self.assertEqual(list(loader._iter_csv(str(self.path))), self.EXPECTED)
+
+    @unittest.skipIf(loader.pa is None, "pyarrow not installed")
+    def test_pyarrow_reader(self):
+        self.assertEqual(list(loader._iter_csv_arrow(str(self.path))), self.EXPECTED)
+
+
+class XlsxColumnsTest(unittest.TestCase):
+    """The .xlsx reader validates the header up front and keeps the first duplicate column."""
+
+    def setUp(self):
+        self.path = temp_path(self, "input.xlsx")
+
+    def write(self, rows):
+        wb = Workbook()
+        for row in rows:
+            wb.active.append(row)
+        wb.save(self.path)
+
+    def test_missing_trn_column_without_data(self):
+        self.write([["Registration No", "Name"]])
+        with self.assertRaises(ValueError):
+            loader.iter_input_data(str(self.path))
+
+    def test_duplicate_column_first_wins(self):
+        self.write([
+            ["Customer TRN", "CUSTOMER_TRN", "Name"],
+            [111, 222, "A"],
+            [None, None, "B"],
+        ])
+        self.assertEqual(list(loader.iter_input_data(str(self.path))), [
+            {'InputRow': 1, 'CUSTOMER_TRN': '111'},
+            {'InputRow': 2, 'CUSTOMER_TRN': None},
+        ])
+
+
+if __name__ == '__main__':
+    unittest.main()
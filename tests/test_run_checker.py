@@ -0,0 +1,115 @@
+"""
+test_run_checker.py - Tests for the concurrent row checker
+===========================================================
+Run with:
+    python -m unittest discover tests
+"""
+
+import asyncio
+import unittest
+from collections import Counter
+
+from checker.run_checker import check_all_rows
+
+
+class FakeClient:
+    """
+    Stands in for AsyncHttpClient: answers from memory after a short delay.
+
+    TRNs ending in an even digit are present (200 with data), the others
+    absent (404). Lower TRNs take longer, so lookups finish out of order.
+    """
+
+    def __init__(self):
+        self.calls = Counter()  # TRN -> number of requests
+
+    async def get_json(self, path, params=None):
+        trn = params["trn"]
+        self.calls[trn] += 1
+        await asyncio.sleep(0.001 * (100 - int(trn) % 100))
+        if int(trn) % 2 == 0:
+            return 200, "application/json", b'[{"id": 1}]'
+        return 404, "application/json", b""
+
+
+def make_rows(trns):
+    return [
+        {'InputRow': i, 'CUSTOMER_TRN': trn, 'REGISTRATION_NO': f"SLB-{i}"}
+        for i, trn in enumerate(trns, start=1)
+    ]
+
+
+class CheckAllRowsTest(unittest.TestCase):
+    """Ordering, shared lookups, the cache and cancellation in check_all_rows()."""
+
+    def check(self, client, rows, cache=None, on_result=None):
+        """Run check_all_rows() and return the results in the order they were handed out."""
+        results = []
+
+        async def run():
+            await check_all_rows(
+                client, iter(rows), "2025", on_result or results.append, cache, 4
+            )
+
+        asyncio.run(run())
+        return results
+
+    def test_results_in_input_order(self):
+        rows = make_rows([str(100000000 + i) for i in range(50)])
+        results = self.check(FakeClient(), rows)
+        self.assertEqual([r.InputRow for r in results], list(range(1, 51)))
+        self.assertEqual([r.TRN for r in results], [row['CUSTOMER_TRN'] for row in rows])
+
+    def test_repeated_trn_is_looked_up_once(self):
+        client = FakeClient()
+        rows = make_rows(["100000001", "100000002", "100000001", "100000001", "100000003", "100000002"])
+        results = self.check(client, rows)
+
+        self.assertEqual(client.calls, {"100000001": 1, "100000002": 1, "100000003": 1})
+
+        # Every row keeps its own identifying fields
+        self.assertEqual([r.InputRow for r in results], [1, 2, 3, 4, 5, 6])
+        self.assertEqual([r.ApplicationNumber for r in results], [f"SLB-{i}" for i in range(1, 7)])
+        self.assertEqual([r.Present for r in results], [False, True, False, False, False, True])
+
+    def test_row_without_trn(self):
+        client = FakeClient()
+        results = self.check(client, make_rows([None]))
+        self.assertFalse(client.calls)
+        self.assertEqual(results[0].Note, "No valid identifier (CUSTOMER_TRN) found")
+
+    def test_cache_hit_skips_lookup(self):
+        client = FakeClient()
+        cache = {("100000002", "2025"): {
+            'EndpointUsed': "/cached", 'HTTPStatus': 200, 'Present': True,
+            'Note': "Present (200 OK with data)", 'CheckedAt': "2025-11-24T21:00:12",
+        }}
+        results = self.check(client, make_rows(["100000002", "100000003"]), cache)
+
+        self.assertEqual(client.calls, {"100000003": 1})
+        self.assertEqual(results[0].Note, "Present (200 OK with data) (cached)")
+
+        # The new definite answer was added to the cache
+        self.assertFalse(cache[("100000003", "2025")]['Present'])
+
+    def test_error_stops_and_cancels_everything(self):
+        leftover = []
+
+        def on_result(result):
+            if result.InputRow == 3:
+                raise RuntimeError("stop")
+
+        async def run():
+            rows = make_rows([str(100000000 + i) for i in range(50)])
+            with self.assertRaises(RuntimeError):
+                await check_all_rows(FakeClient(), iter(rows), "2025", on_result, None, 4)
+
+            # No lookup or row task is left running
+            leftover.extend(t for t in asyncio.all_tasks() if t is not asyncio.current_task())
+
+        asyncio.run(run())
+        self.assertEqual(leftover, [])
+
+
+if __name__ == '__main__':
+    unittest.main()